@@ -0,0 +1,455 @@
+import json
+import resource
+import sys
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from time import perf_counter
+from typing import Any, Callable
+
+from stream_processor import LogProcessor, NumericProcessor, TextProcessor
+
+LEVELS: list[str] = ["ERROR", "INFO", "WARN", "DEBUG"]
+WORDS: list[str] = ["nexus", "stream", "data", "élan", "flux", "core"]
+
+Case = tuple[int, Callable[[], Any]]
+
+
+def make_numbers(count: int) -> list[float]:
+    """
+    Build a list of floats.
+
+    Args:
+        count (int): Number of values to generate.
+
+    Returns:
+        list[float]: The generated values.
+    """
+    return [(i % 1000) * 0.5 for i in range(count)]
+
+
+def make_text(count: int) -> str:
+    """
+    Build one long text made of `count` words.
+
+    Args:
+        count (int): Number of words to generate.
+
+    Returns:
+        str: The generated text.
+    """
+    return " ".join(WORDS[i % 6] for i in range(count))
+
+
+def make_logs(count: int) -> list[str]:
+    """
+    Build a list of log lines with mixed levels.
+
+    Args:
+        count (int): Number of lines to generate.
+
+    Returns:
+        list[str]: The generated log lines.
+    """
+    return [
+        f"{LEVELS[i % 4]}: event {i} on node {i % 17}" for i in range(count)
+    ]
+
+
+def numeric_list(size: int) -> Case:
+    """
+    NumericProcessor on a plain list.
+
+    Args:
+        size (int): Number of elements.
+
+    Returns:
+        Case: Payload size in bytes and the workload.
+    """
+    proc: NumericProcessor = NumericProcessor()
+    data: list[float] = make_numbers(size)
+    return 8 * size, lambda: proc.process_raw(data)
+
+
+def numeric_array(size: int) -> Case:
+    """
+    NumericProcessor on an array('d').
+
+    Args:
+        size (int): Number of elements.
+
+    Returns:
+        Case: Payload size in bytes and the workload.
+    """
+    proc: NumericProcessor = NumericProcessor()
+    data: array = array("d", make_numbers(size))
+    return 8 * size, lambda: proc.process_raw(data)
+
+
+def text_short(size: int) -> Case:
+    """
+    TextProcessor on many short texts, one call each.
+
+    Args:
+        size (int): Number of texts.
+
+    Returns:
+        Case: Payload size in bytes and the workload.
+    """
+    proc: TextProcessor = TextProcessor()
+    data: list[str] = [WORDS[i % 6] + " world" for i in range(size)]
+    nbytes: int = sum(len(text.encode()) for text in data)
+    return nbytes, lambda: [proc.process_raw(text) for text in data]
+
+
+def text_long(size: int) -> Case:
+    """
+    TextProcessor streaming over one long text.
+
+    Args:
+        size (int): Number of words.
+
+    Returns:
+        Case: Payload size in bytes and the workload.
+    """
+    proc: TextProcessor = TextProcessor()
+    data: bytes = make_text(size).encode()
+    return len(data), lambda: proc.count_stream([data])
+
+
+def logs_per_line(size: int) -> Case:
+    """
+    LogProcessor called once per line.
+
+    Args:
+        size (int): Number of log lines.
+
+    Returns:
+        Case: Payload size in bytes and the workload.
+    """
+    proc: LogProcessor = LogProcessor()
+    data: list[str] = make_logs(size)
+    nbytes: int = sum(map(len, data))
+    return nbytes, lambda: [proc.process(x) for x in data if proc.validate(x)]
+
+
+def reference_validate(data: Any) -> bool:
+    """
+    Validate a log line the way LogProcessor did before its regex.
+
+    Kept as the reference the per-line cases are measured against.
+
+    Args:
+        data (Any): The log entry to validate.
+
+    Returns:
+        bool: True if the log format is valid.
+    """
+    if type(data) is not str:
+        return False
+    if data == "":
+        return False
+
+    if data[:6] == "ERROR:":
+        return True
+
+    elif data[:5] == "INFO:":
+        return True
+
+    elif data[:5] == "WARN:":
+        return True
+
+    return False
+
+
+def reference_process(data: Any) -> str:
+    """
+    Process a log line the way LogProcessor did before its regex.
+
+    Args:
+        data (Any): The log string to process.
+
+    Returns:
+        str: Formatted alert message or error output.
+    """
+    try:
+        if not reference_validate(data):
+            raise ValueError("Invalid Data")
+
+        i: int = 0
+        for c in data:
+            if c == ":":
+                break
+            i += 1
+
+        level: str = data[:i]
+        message: str = data[i + 1:]
+
+        if message != "" and message[0] == " ":
+            message = message[1:]
+
+        if data[:5] == "ERROR":
+            return f"[ALERT] {level} level detected: {message}"
+        elif data[:4] == "INFO":
+            return f"[INFO] {level} level detected: {message}"
+        elif data[:4] == "WARN":
+            return f"[WARN] {level} level detected: {message}"
+        else:
+            return "ERROR"
+
+    except ValueError as e:
+        print(e)
+        return "ERROR"
+
+
+def logs_reference(size: int) -> Case:
+    """
+    Original per-line log path: prefix chain and manual ':' scan.
+
+    Args:
+        size (int): Number of log lines.
+
+    Returns:
+        Case: Payload size in bytes and the workload.
+    """
+    data: list[str] = make_logs(size)
+    nbytes: int = sum(map(len, data))
+    return nbytes, lambda: [
+        reference_process(x) for x in data if reference_validate(x)
+    ]
+
+
+def logs_many(size: int) -> Case:
+    """
+    LogProcessor.process_many on a whole batch.
+
+    Args:
+        size (int): Number of log lines.
+
+    Returns:
+        Case: Payload size in bytes and the workload.
+    """
+    proc: LogProcessor = LogProcessor()
+    data: list[str] = make_logs(size)
+    nbytes: int = sum(map(len, data))
+    return nbytes, lambda: proc.process_many(data)
+
+
+CASES: dict[str, Callable[[int], Case]] = {
+    "numeric_list": numeric_list,
+    "numeric_array": numeric_array,
+    "text_short": text_short,
+    "text_long": text_long,
+    "logs_reference": logs_reference,
+    "logs_per_line": logs_per_line,
+    "logs_many": logs_many,
+}
+
+
+def peak_rss_kib() -> int:
+    """
+    Return the peak resident set size of the process.
+
+    The peak never goes down, so `isolated` runs every case in a fresh
+    process to get a figure per case.
+
+    Returns:
+        int: Peak RSS in KiB (bytes on macOS).
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def isolated(
+    name: str, size: int, repeat: int, min_time: float
+) -> dict[str, Any]:
+    """
+    Run `measure` in a fresh worker process.
+
+    Args:
+        name (str): Case name from CASES.
+        size (int): Number of elements.
+        repeat (int): Timed runs, the best one is kept.
+        min_time (float): Shortest timed run, in seconds.
+
+    Returns:
+        dict[str, Any]: The measurements of the case.
+    """
+    with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(measure, name, size, repeat, min_time).result()
+
+
+def autorange(work: Callable[[], Any], min_time: float) -> int:
+    """
+    Find how many calls a timed run needs, like timeit.autorange.
+
+    Args:
+        work (Callable[[], Any]): The workload.
+        min_time (float): Shortest timed run, in seconds.
+
+    Returns:
+        int: Calls per timed run, from the 1, 2, 5, 10... sequence.
+    """
+    number: int = 1
+    while True:
+        for factor in (1, 2, 5):
+            calls: int = number * factor
+            start: float = perf_counter()
+            for _ in range(calls):
+                work()
+            if perf_counter() - start >= min_time:
+                return calls
+        number *= 10
+
+
+def measure(
+    name: str, size: int, repeat: int, min_time: float
+) -> dict[str, Any]:
+    """
+    Time one case and trace its allocations.
+
+    Each timed run loops over the workload for at least `min_time`
+    so small sizes are not dominated by timer noise.
+
+    Args:
+        name (str): Case name from CASES.
+        size (int): Number of elements.
+        repeat (int): Timed runs, the best one is kept.
+        min_time (float): Shortest timed run, in seconds.
+
+    Returns:
+        dict[str, Any]: The measurements of the case.
+    """
+    nbytes, work = CASES[name](size)
+    calls: int = autorange(work, min_time)
+    best: float = float("inf")
+    for _ in range(repeat):
+        start: float = perf_counter()
+        for _ in range(calls):
+            work()
+        best = min(best, (perf_counter() - start) / calls)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result: Any = work()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks: int = sum(
+        stat.count_diff for stat in after.compare_to(before, "filename")
+    )
+    del result
+
+    return {
+        "case": name,
+        "size": size,
+        "seconds": best,
+        "ops_per_sec": size / best,
+        "bytes_per_sec": nbytes / best,
+        "peak_rss_kib": peak_rss_kib(),
+        "traced_peak_bytes": peak,
+        "allocated_blocks": blocks,
+    }
+
+
+def compare(
+    results: list[dict[str, Any]], baseline_path: str, threshold: float
+) -> list[str]:
+    """
+    Compare results with a stored baseline.
+
+    Args:
+        results (list[dict[str, Any]]): The current measurements.
+        baseline_path (str): JSON file written by a previous run.
+        threshold (float): Allowed relative ops/sec drop.
+
+    Returns:
+        list[str]: One message per regression.
+    """
+    with open(baseline_path) as file:
+        baseline: dict[tuple[str, int], float] = {
+            (entry["case"], entry["size"]): entry["ops_per_sec"]
+            for entry in json.load(file)
+        }
+
+    regressions: list[str] = []
+    for entry in results:
+        old: float | None = baseline.get((entry["case"], entry["size"]))
+        if old is None:
+            continue
+        change: float = entry["ops_per_sec"] / old - 1
+        if change < -threshold:
+            regressions.append(
+                f"{entry['case']} size={entry['size']}: "
+                f"{change:+.1%} ops/sec"
+            )
+    return regressions
+
+
+def parse_args(argv: list[str]) -> Namespace:
+    """
+    Parse the command line.
+
+    Args:
+        argv (list[str]): Command line arguments.
+
+    Returns:
+        Namespace: The parsed options.
+    """
+    parser = ArgumentParser(description="Benchmark the data processors.")
+    parser.add_argument("--min-size", type=int, default=1_000)
+    parser.add_argument("--max-size", type=int, default=1_000_000,
+                        help="largest dataset, up to 100000000")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="shortest timed run in seconds")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES),
+                        default=list(CASES))
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--baseline", help="JSON results to compare with")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed ops/sec drop, 0.10 means 10%%")
+    return parser.parse_args(argv)
+
+
+def main() -> None:
+    args: Namespace = parse_args(sys.argv[1:])
+    sizes: list[int] = []
+    size: int = args.min_size
+    while size <= args.max_size:
+        sizes.append(size)
+        size *= 10
+
+    results: list[dict[str, Any]] = []
+    print(f"{'case':<15}{'size':>11}{'ops/s':>15}{'MB/s':>10}"
+          f"{'blocks':>9}{'rss MiB':>9}")
+    for name in args.cases:
+        for size in sizes:
+            entry: dict[str, Any] = isolated(
+                name, size, args.repeat, args.min_time
+            )
+            results.append(entry)
+            print(f"{name:<15}{size:>11}{entry['ops_per_sec']:>15,.0f}"
+                  f"{entry['bytes_per_sec'] / 1e6:>10.1f}"
+                  f"{entry['allocated_blocks']:>9}"
+                  f"{entry['peak_rss_kib'] / 1024:>9.1f}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        regressions: list[str] = compare(
+            results, args.baseline, args.threshold
+        )
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            sys.exit(1)
+        print("No regression against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,113 @@
 
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any
+from array import array
+from codecs import getincrementaldecoder
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import wraps
+from hashlib import blake2b
+from itertools import repeat
+from math import fsum, isnan
+from operator import sub
+from re import DOTALL, Pattern, compile as re_compile, escape
+from typing import (
+    Any, AsyncIterator, Callable, Iterable, Iterator, NamedTuple
+)
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE: bool = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+FLOAT_CODES: str = "fd"
+INT_CODES: str = "bBhHiIlLqQ"
+CHUNK_SIZE: int = 1 << 20
+BUFFER_TYPES: tuple[type, ...] = (bytes, bytearray, memoryview)
+# UTF-8 continuation bytes, which never start a character.
+CONTINUATION: bytes = bytes(range(0x80, 0xC0))
+# Maps the space to itself and every other byte to "a", so words
+# start exactly where b" a" (or a leading "a") appears.
+WORD_TABLE: bytes = bytes(0x20 if b == 0x20 else 0x61 for b in range(256))
+HASHABLE_TYPES: tuple[type, ...] = (
+    str, bytes, tuple, frozenset, int, float, memoryview
+)
+
+
+class NumericStats(NamedTuple):
+    """Statistics produced by NumericProcessor.process_raw."""
+    count: int
+    total: float
+    mean: float
+
+    def render(self) -> str:
+        """
+        Render the statistics as a result line.
+
+        Returns:
+            str: The formatted statistics.
+        """
+        return (
+            f"Processed {self.count} numeric values, "
+            f"sum={self.total}, avg={self.mean:.1f}"
+        )
+
+
+class TextStats(NamedTuple):
+    """Statistics produced by TextProcessor.process_raw."""
+    chars: int
+    words: int
+
+    def render(self) -> str:
+        """
+        Render the statistics as a result line.
+
+        Returns:
+            str: The formatted statistics.
+        """
+        return f"Processed text: {self.chars} characters, {self.words} words"
+
+
+class LogRecord(NamedTuple):
+    """
+    Parsed log entry produced by LogProcessor.process_raw.
+
+    For bytes input the message is a memoryview slice of the original
+    buffer, decoded only when the record is rendered.
+    """
+    level: str
+    message: str | memoryview
+    tag: str
+
+    def render(self) -> str:
+        """
+        Render the record as an alert line.
+
+        Returns:
+            str: The formatted alert message.
+        """
+        message: str | memoryview = self.message
+        if type(message) is not str:
+            message = str(message, "utf-8", "replace")
+        return f"[{self.tag}] {self.level} level detected: {message}"
+
+
+def _is_buffer(data: Any) -> bool:
+    """
+    Tell whether a value is a non-empty flat byte buffer.
+
+    Args:
+        data (Any): The value to check.
+
+    Returns:
+        bool: True for non-empty bytes, bytearray or byte memoryview.
+    """
+    if type(data) is memoryview:
+        return data.itemsize == 1 and data.contiguous and data.nbytes > 0
+    return type(data) in BUFFER_TYPES and len(data) > 0
 
 
 class DataProcessor(ABC):
@@ -37,18 +143,204 @@ class DataProcessor(ABC):
         """
         pass
 
-    def format_output(self, result: str) -> str:
+    @abstractmethod
+    def process_raw(self, data: Any) -> Any:
+        """
+        Process the input data into a structured result record.
+
+        Args:
+            data (Any): The input data to process.
+
+        Returns:
+            Any: A result record with a `render` method.
+
+        Raises:
+            ValueError: If the data is invalid.
+        """
+        pass
+
+    def format_output(self, result: Any) -> str:
         """
         Format the final output string for processors.
 
+        Result records from `process_raw` are only rendered here.
+
         Args:
-            result (str): The raw result string.
+            result (Any): The raw result string or result record.
 
         Returns:
             str: The formatted output prefixed with 'Output:'.
         """
+        if type(result) is not str:
+            result = result.render()
         return f"Output: {result}"
 
+    _validation_cache: "OrderedDict[tuple, bool] | None" = None
+    _cache_versions: dict[int, Any] = {}
+    _cache_maxsize: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def enable_validation_cache(self, maxsize: int = 128) -> None:
+        """
+        Remember validation results so a payload is only scanned once.
+
+        Immutable payloads (str, bytes, tuple, read-only memoryview...)
+        are keyed by their hash, type and length. Mutable ones are only
+        cached once the caller gives them a version with
+        `cache_version`, and are then keyed by identity plus that
+        version. Only validation results are stored, never the
+        payloads themselves.
+
+        Args:
+            maxsize (int): Number of results kept before LRU eviction.
+        """
+        self._validation_cache = OrderedDict()
+        self._cache_versions = {}
+        self._cache_maxsize = maxsize
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def disable_validation_cache(self) -> None:
+        """
+        Drop the validation cache and its contents.
+        """
+        self._validation_cache = None
+        self._cache_versions = {}
+
+    def cache_version(self, data: Any, version: Any) -> None:
+        """
+        Let a mutable payload use the validation cache.
+
+        Pass a new version every time the payload is edited in place.
+        The payload is tracked by identity, so call `invalidate` before
+        dropping it, or a new object reusing its id could be served
+        its stale result.
+
+        Args:
+            data (Any): The mutable payload, a list for instance.
+            version (Any): Hashable token identifying its content.
+        """
+        if self._validation_cache is not None:
+            self._cache_versions[id(data)] = version
+
+    def invalidate(self, data: Any) -> None:
+        """
+        Forget the cached validation result and version of a payload.
+
+        Args:
+            data (Any): The payload whose result must be recomputed.
+        """
+        if self._validation_cache is None:
+            return
+        key: tuple | None = _cache_key(data, self._cache_versions)
+        if key is not None:
+            self._validation_cache.pop(key, None)
+        self._cache_versions.pop(id(data), None)
+
+    def cache_info(self) -> dict[str, int]:
+        """
+        Return validation cache statistics.
+
+        Returns:
+            dict[str, int]: Hits, misses, current size and maxsize.
+        """
+        cache = self._validation_cache
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": 0 if cache is None else len(cache),
+            "maxsize": self._cache_maxsize,
+        }
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Pickle the processor without its cached payloads.
+
+        Returns:
+            dict[str, Any]: The instance state to pickle.
+        """
+        state: dict[str, Any] = self.__dict__.copy()
+        if state.get("_validation_cache") is not None:
+            state["_validation_cache"] = OrderedDict()
+            state["_cache_versions"] = {}
+        return state
+
+
+def _cache_key(data: Any, versions: dict[int, Any]) -> tuple | None:
+    """
+    Build the validation cache key of a payload.
+
+    Scalars are keyed by value. Other immutable payloads are keyed by
+    type, length and hash. Read-only contiguous memoryviews, which
+    `hash` only accepts for byte formats over hashable exporters, are
+    keyed by exporter type, format, shape and a BLAKE2 digest of their
+    bytes. The key never references the payload.
+
+    Args:
+        data (Any): The payload to key.
+        versions (dict[int, Any]): Versions of the mutable payloads,
+        by identity.
+
+    Returns:
+        tuple | None: The key, or None if the payload can't be cached.
+    """
+    kind: type = type(data)
+    if kind is memoryview:
+        if data.readonly and data.c_contiguous:
+            return (
+                "view", type(data.obj), data.format, data.shape,
+                blake2b(data, digest_size=16).digest(),
+            )
+    elif kind is int or kind is float:
+        return ("value", kind, data)
+    elif isinstance(data, HASHABLE_TYPES):
+        try:
+            return ("value", kind, len(data), hash(data))
+        except TypeError:
+            pass
+    version: Any = versions.get(id(data))
+    if version is None:
+        return None
+    return ("id", id(data), version)
+
+
+def cached_validation(
+    validate: Callable[[Any, Any], bool]
+) -> Callable[[Any, Any], bool]:
+    """
+    Decorate a `validate` method to go through the validation cache.
+
+    Args:
+        validate (Callable[[Any, Any], bool]): The validate method.
+
+    Returns:
+        Callable[[Any, Any], bool]: The caching validate method.
+    """
+    @wraps(validate)
+    def wrapper(self: DataProcessor, data: Any) -> bool:
+        cache = self._validation_cache
+        if cache is None:
+            return validate(self, data)
+        key: tuple | None = _cache_key(data, self._cache_versions)
+        if key is None:
+            return validate(self, data)
+
+        entry: bool | None = cache.get(key)
+        if entry is not None:
+            cache.move_to_end(key)
+            self.cache_hits += 1
+            return entry
+
+        self.cache_misses += 1
+        result: bool = validate(self, data)
+        cache[key] = result
+        if len(cache) > self._cache_maxsize:
+            cache.popitem(last=False)
+        return result
+
+    return wrapper
+
 
 class NumericProcessor(DataProcessor):
     """
@@ -56,7 +348,25 @@ class NumericProcessor(DataProcessor):
 
     Validates that the input is a non-empty list of numbers and
     computes basic statistics (count, sum, average).
+
+    Lists shorter than `batch_threshold` go through a plain Python
+    loop. Larger lists, `array.array`, memoryviews and NumPy arrays
+    are handled by the batch API, which does each step in a single
+    C-level pass. The threshold is where the batch API starts beating
+    the loop in `benchmark.py`.
     """
+    batch_threshold: int = 100
+
+    def __init__(self, allow_nan: bool = False):
+        """
+        Initialize the NumericProcessor.
+
+        Args:
+            allow_nan (bool): Accept NaN values in the input data.
+        """
+        self.allow_nan: bool = allow_nan
+
+    @cached_validation
     def validate(self, data: Any) -> bool:
         """
         Validate that the input is a non-empty list of int or float.
@@ -67,8 +377,8 @@ class NumericProcessor(DataProcessor):
         Returns:
             bool: True if the data is a valid numeric list.
         """
-        if type(data) is not list:
-            return False
+        if type(data) is not list or len(data) >= self.batch_threshold:
+            return self.validate_batch(data)
 
         count: int = 0
         for x in data:
@@ -77,9 +387,56 @@ class NumericProcessor(DataProcessor):
                 return False
             if type(x) is not int and type(x) is not float:
                 return False
+            if x != x and not self.allow_nan:
+                return False
 
         return count > 0
 
+    def validate_batch(self, data: Any) -> bool:
+        """
+        Validate a numeric batch in one vectorized pass.
+
+        Accepts lists, `array.array` and memoryviews with a numeric
+        typecode, and NumPy arrays with an integer or float dtype.
+        Byte memoryviews over bytes or bytearray are raw text buffers
+        and are rejected. Booleans are rejected, NaN only passes if
+        `allow_nan` is set.
+
+        Args:
+            data (Any): The batch to validate.
+
+        Returns:
+            bool: True if the batch is a valid non-empty numeric batch.
+        """
+        if NUMPY_AVAILABLE and isinstance(data, np.ndarray):
+            if data.size == 0 or data.dtype.kind not in "iuf":
+                return False
+            if data.dtype.kind == "f" and not self.allow_nan:
+                return not bool(np.isnan(data).any())
+            return True
+
+        if type(data) is list:
+            if not data or not set(map(type, data)) <= {int, float}:
+                return False
+        elif type(data) is array:
+            if not data or data.typecode not in FLOAT_CODES + INT_CODES:
+                return False
+        elif type(data) is memoryview:
+            if data.ndim != 1 or not data:
+                return False
+            if data.itemsize == 1 and isinstance(
+                data.obj, (bytes, bytearray)
+            ):
+                return False
+            if data.format.lstrip("@=<>!") not in FLOAT_CODES + INT_CODES:
+                return False
+        else:
+            return False
+
+        if self.allow_nan:
+            return True
+        return not any(map(isnan, data))
+
     def process(self, data: Any) -> str:
         """
         Process numeric data and compute statistics.
@@ -91,16 +448,29 @@ class NumericProcessor(DataProcessor):
             str: Formatted statistics or error output.
         """
         try:
-            if not self.validate(data):
-                raise ValueError("Invalid Data")
-
-            count, sm, avg = self.info(data)
-            return f"Processed {count} numeric values, sum={sm}, avg={avg:.1f}"
+            return self.process_raw(data).render()
 
         except ValueError as e:
             print(e)
             return "ERROR"
 
+    def process_raw(self, data: Any) -> NumericStats:
+        """
+        Process numeric data into a statistics record.
+
+        Args:
+            data (Any): The numeric data to process.
+
+        Returns:
+            NumericStats: Count, sum and average of the data.
+
+        Raises:
+            ValueError: If the data is invalid.
+        """
+        if not self.validate(data):
+            raise ValueError("Invalid Data")
+        return NumericStats(*self.info(data))
+
     def info(self, data: Any) -> tuple[int, float, float]:
         """
         Compute numeric statistics from the data.
@@ -109,9 +479,18 @@ class NumericProcessor(DataProcessor):
             data (Any): Validated numeric list.
 
         Returns:
-            dict[str, int | float]: Dictionary containing length,
-            sum, and average of the numbers.
+            tuple[int, float, float]: Length, sum, and average
+            of the numbers.
         """
+        if type(data) is not list or len(data) >= self.batch_threshold:
+            if NUMPY_AVAILABLE and isinstance(data, np.ndarray):
+                count: int = int(data.size)
+                total: float = data.sum().item()
+            else:
+                count = len(data)
+                total = sum(data)
+            return count, total, total / count
+
         length: int = 0
         somme: float = 0
 
@@ -122,16 +501,180 @@ class NumericProcessor(DataProcessor):
         average: float = somme / length
         return length, somme, average
 
+    @staticmethod
+    def batch_stats(
+        data: Any
+    ) -> tuple[int, float, float, float, float, float]:
+        """
+        Compute batch statistics without a Python-level loop.
+
+        Args:
+            data (Any): Validated numeric batch.
+
+        Returns:
+            tuple[int, float, float, float, float, float]: Count, sum,
+            mean, min, max and population variance.
+        """
+        if NUMPY_AVAILABLE and isinstance(data, np.ndarray):
+            return (
+                int(data.size), data.sum().item(), float(data.mean()),
+                data.min().item(), data.max().item(), float(data.var())
+            )
+
+        count: int = len(data)
+        total: float = sum(data) if type(data) is list else fsum(data)
+        mean: float = total / count
+        # Shift by the first value to keep the sum of squares stable.
+        shift: float = data[0]
+        shifted: float = fsum(map(sub, data, repeat(shift)))
+        squares: float = fsum(
+            map(pow, map(sub, data, repeat(shift)), repeat(2))
+        )
+        variance: float = max(
+            squares / count - (shifted / count) ** 2, 0.0
+        )
+        return count, total, mean, min(data), max(data), variance
+
+    def accumulate(
+        self, data: Any, accumulator: "NumericAccumulator | None" = None
+    ) -> "NumericAccumulator":
+        """
+        Validate a chunk and fold it into a running accumulator.
+
+        Args:
+            data (Any): The numeric chunk to add.
+            accumulator (NumericAccumulator | None): Accumulator to
+            update, a new one is created if omitted.
+
+        Returns:
+            NumericAccumulator: The updated accumulator.
+
+        Raises:
+            ValueError: If the data is invalid.
+        """
+        if not self.validate(data):
+            raise ValueError("Invalid Data")
+        if accumulator is None:
+            accumulator = NumericAccumulator()
+        accumulator.update_batch(data)
+        return accumulator
+
+
+class NumericAccumulator:
+    """
+    Running numeric statistics that can be fed chunk by chunk.
+
+    Keeps count, sum, min, max and the Welford mean/variance terms.
+    Partial accumulators built on other shards or workers combine
+    exactly with `merge`, so a dataset never has to be scanned twice.
+    """
+    __slots__ = ("count", "total", "mean", "m2", "minimum", "maximum")
+
+    def __init__(self):
+        """
+        Initialize an empty accumulator.
+        """
+        self.count: int = 0
+        self.total: float = 0
+        self.mean: float = 0.0
+        self.m2: float = 0.0
+        self.minimum: float = float("inf")
+        self.maximum: float = float("-inf")
+
+    @property
+    def variance(self) -> float:
+        """
+        Population variance of the values seen so far.
+
+        Returns:
+            float: The variance, 0.0 when empty.
+        """
+        return self.m2 / self.count if self.count else 0.0
+
+    def update(self, value: float) -> None:
+        """
+        Add a single value with Welford's update.
+
+        Args:
+            value (float): The value to add.
+        """
+        self.count += 1
+        self.total += value
+        delta: float = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    def update_batch(self, data: Any) -> None:
+        """
+        Add a whole numeric batch using its vectorized statistics.
+
+        Args:
+            data (Any): A non-empty, validated numeric batch.
+        """
+        count, total, mean, low, high, variance = (
+            NumericProcessor.batch_stats(data)
+        )
+        self._combine(count, total, mean, variance * count, low, high)
+
+    def merge(self, other: "NumericAccumulator") -> "NumericAccumulator":
+        """
+        Fold another accumulator into this one.
+
+        Args:
+            other (NumericAccumulator): The partial result to merge.
+
+        Returns:
+            NumericAccumulator: This accumulator, updated.
+        """
+        if other.count:
+            self._combine(
+                other.count, other.total, other.mean, other.m2,
+                other.minimum, other.maximum,
+            )
+        return self
+
+    def _combine(
+        self, count: int, total: float, mean: float, m2: float,
+        low: float, high: float,
+    ) -> None:
+        """
+        Combine partial statistics with Chan's parallel formula.
+
+        Args:
+            count (int): Number of values in the partial.
+            total (float): Their sum.
+            mean (float): Their mean.
+            m2 (float): Their sum of squared deviations.
+            low (float): Their minimum.
+            high (float): Their maximum.
+        """
+        merged: int = self.count + count
+        delta: float = mean - self.mean
+        self.mean += delta * count / merged
+        self.m2 += m2 + delta * delta * self.count * count / merged
+        self.count = merged
+        self.total += total
+        self.minimum = min(self.minimum, low)
+        self.maximum = max(self.maximum, high)
+
 
 class TextProcessor(DataProcessor):
     """
     Processor specialized in handling textual data.
 
     Validates string input and computes character and word counts.
+    UTF-8 bytes, bytearray and memoryview input are counted directly,
+    without decoding. Words are separated by spaces for every input
+    type.
     """
+    @cached_validation
     def validate(self, data: Any) -> bool:
         """
-        Validate that the input is a non-empty string.
+        Validate that the input is a non-empty string or byte buffer.
 
         Args:
             data (Any): The input data to validate.
@@ -140,7 +683,7 @@ class TextProcessor(DataProcessor):
             bool: True if the data is a valid string.
         """
         if type(data) is not str:
-            return False
+            return _is_buffer(data)
         if data == "":
             return False
         return True
@@ -156,16 +699,31 @@ class TextProcessor(DataProcessor):
             str: Formatted text statistics or error output.
         """
         try:
-            if not self.validate(data):
-                raise ValueError("Invalid Data")
-
-            char, words = self.count_chars_words(data)
-            return f'Processed text: {char} characters, {words} words'
+            return self.process_raw(data).render()
 
         except ValueError as e:
             print(e)
             return "ERROR"
 
+    def process_raw(self, data: Any) -> TextStats:
+        """
+        Process text data into a statistics record.
+
+        Args:
+            data (Any): The text to process.
+
+        Returns:
+            TextStats: Character and word counts.
+
+        Raises:
+            ValueError: If the data is invalid.
+        """
+        if not self.validate(data):
+            raise ValueError("Invalid Data")
+        if type(data) is not str:
+            return TextStats(*self.count_buffer(data))
+        return TextStats(*self.count_chars_words(data))
+
     def count_chars_words(self, data: str) -> tuple[int, int]:
         """
         Count characters and words in a string.
@@ -191,19 +749,194 @@ class TextProcessor(DataProcessor):
 
         return char_count, word_count
 
+    def count_buffer(self, data: Any) -> tuple[int, int]:
+        """
+        Count characters and words of UTF-8 bytes without decoding.
+
+        Characters are the bytes that are not UTF-8 continuation bytes,
+        words are separated by spaces as in `count_chars_words`. The
+        buffer is handled CHUNK_SIZE bytes at a time: each chunk is
+        translated once through WORD_TABLE, which drops continuation
+        bytes, and word starts are counted on the result. No word is
+        ever copied out.
+
+        Args:
+            data (Any): bytes, bytearray or byte memoryview.
+
+        Returns:
+            tuple[int, int]: Number of characters and words.
+        """
+        view: memoryview = memoryview(data).cast("B")
+        char_count: int = 0
+        word_count: int = 0
+        in_word: bool = False
+        for start in range(0, len(view), CHUNK_SIZE):
+            chunk: bytes = view[start:start + CHUNK_SIZE].tobytes()
+            symbols: bytes = chunk.translate(WORD_TABLE, CONTINUATION)
+            if not symbols:
+                continue
+            char_count += len(symbols)
+            word_count += symbols.count(b" a")
+            if not in_word and symbols[0] != 0x20:
+                word_count += 1
+            in_word = symbols[-1] != 0x20
+        return char_count, word_count
+
+    def process_stream(self, source: Any, chunk_size: int = CHUNK_SIZE) -> str:
+        """
+        Process a text stream and compute its statistics.
+
+        Args:
+            source (Any): File object or iterable of str/bytes chunks.
+            chunk_size (int): Read size used for file objects.
+
+        Returns:
+            str: Formatted stream statistics.
+        """
+        chars, words, lines, size = self.count_stream(source, chunk_size)
+        return (
+            f"Processed text stream: {chars} characters, {words} words, "
+            f"{lines} lines, {size} bytes"
+        )
+
+    def count_stream(
+        self, source: Any, chunk_size: int = CHUNK_SIZE
+    ) -> tuple[int, int, int, int]:
+        """
+        Count characters, words, lines and bytes of a chunked stream.
+
+        Memory use is bounded by the chunk size. Words are separated by
+        any Unicode whitespace, as with `str.split()`, so line breaks
+        end words, and may span chunk boundaries. Bytes are decoded as
+        UTF-8, str chunks are measured by their UTF-8 size.
+
+        Args:
+            source (Any): File object or iterable of str/bytes chunks.
+            chunk_size (int): Read size used for file objects.
+
+        Returns:
+            tuple[int, int, int, int]: Characters, words, lines, bytes.
+        """
+        decoder = getincrementaldecoder("utf-8")(errors="replace")
+        char_count: int = 0
+        word_count: int = 0
+        line_count: int = 0
+        byte_count: int = 0
+        in_word: bool = False
+
+        for chunk in _iter_chunks(source, chunk_size):
+            if type(chunk) is str:
+                byte_count += len(chunk.encode("utf-8", "surrogatepass"))
+                text: str = chunk
+            else:
+                byte_count += len(chunk)
+                text = decoder.decode(chunk)
+            if not text:
+                continue
+
+            char_count += len(text)
+            line_count += text.count("\n")
+            word_count += len(text.split())
+            if in_word and not text[0].isspace():
+                word_count -= 1
+            in_word = not text[-1].isspace()
+
+        tail: str = decoder.decode(b"", True)
+        if tail:
+            char_count += len(tail)
+            if not in_word:
+                word_count += 1
+
+        return char_count, word_count, line_count, byte_count
+
+
+def _iter_chunks(source: Any, chunk_size: int) -> Iterator[Any]:
+    """
+    Yield successive chunks from a file object or an iterable.
+
+    Args:
+        source (Any): File object with `read` or iterable of chunks.
+        chunk_size (int): Read size used for file objects.
+
+    Returns:
+        Iterator[Any]: The str or bytes chunks.
+    """
+    if not hasattr(source, "read"):
+        chunks: Iterable[Any] = source
+        yield from chunks
+        return
+
+    chunk: Any = source.read(chunk_size)
+    while chunk:
+        yield chunk
+        chunk = source.read(chunk_size)
+
 
 class LogProcessor(DataProcessor):
     """
     Processor specialized in handling structured log messages.
 
     Validates log level prefixes and extracts level and message
-    for formatted alert reporting.
+    for formatted alert reporting. Levels are matched with a single
+    precompiled regex that can be extended with `add_level`.
     """
+    default_levels: dict[str, str] = {
+        "ERROR": "ALERT",
+        "INFO": "INFO",
+        "WARN": "WARN",
+    }
+
+    def __init__(self, levels: dict[str, str] | None = None):
+        """
+        Initialize the LogProcessor with its level table.
+
+        Args:
+            levels (dict[str, str] | None): Mapping of log level to the
+            alert tag used in formatted output. Defaults to ERROR, INFO
+            and WARN.
+        """
+        self.levels: dict[str, str] = dict(
+            self.default_levels if levels is None else levels
+        )
+        self._compile()
+
+    def add_level(self, level: str, tag: str | None = None) -> None:
+        """
+        Register an extra log level such as DEBUG or CRITICAL.
+
+        Args:
+            level (str): The level prefix, without the colon.
+            tag (str | None): Alert tag for formatted output,
+            defaults to the level itself.
+        """
+        self.levels[level] = level if tag is None else tag
+        self._compile()
+        if self._validation_cache is not None:
+            self._validation_cache.clear()
+
+    def _compile(self) -> None:
+        """
+        Build the regexes matching every known level prefix.
+
+        The str pattern captures the level and the message, the bytes
+        pattern only the level so the message is never copied.
+        """
+        names: list[str] = sorted(self.levels, key=len, reverse=True)
+        alternation: str = "|".join(escape(name) for name in names)
+        self._pattern: Pattern[str] = re_compile(
+            f"({alternation}): ?(.*)", DOTALL
+        )
+        self._bytes_pattern: Pattern[bytes] = re_compile(
+            f"({alternation}): ?".encode("ascii")
+        )
+
+    @cached_validation
     def validate(self, data: Any) -> bool:
         """
         Validate that the input is a properly formatted log string.
 
-        Accepted prefixes: ERROR:, WARN:, INFO:
+        Accepted prefixes: ERROR:, WARN:, INFO: and any added level.
+        The entry may be a str or an ASCII-prefixed byte buffer.
 
         Args:
             data (Any): The log entry to validate.
@@ -211,61 +944,428 @@ class LogProcessor(DataProcessor):
         Returns:
             bool: True if the log format is valid.
         """
-        if type(data) is not str:
-            return False
-        if data == "":
-            return False
-
-        if data[:6] == "ERROR:":
-            return True
-
-        elif data[:5] == "INFO:":
-            return True
-
-        elif data[:5] == "WARN:":
-            return True
-
+        if type(data) is str:
+            return self._pattern.match(data) is not None
+        if _is_buffer(data):
+            return self._bytes_pattern.match(data) is not None
         return False
 
     def process(self, data: Any) -> str:
         """
         Process a log entry and extract level and message.
 
+        A str entry is matched once and formatted directly, without an
+        intermediate LogRecord.
+
         Args:
             data (Any): The log string to process.
 
         Returns:
             str: Formatted alert message or error output.
         """
+        if type(data) is str:
+            match = self._pattern.match(data)
+            if match is not None:
+                level, message = match.groups()
+                return (
+                    f"[{self.levels[level]}] {level} level detected: "
+                    f"{message}"
+                )
         try:
-            if not self.validate(data):
-                raise ValueError("Invalid Data")
-
-            i: int = 0
-            for c in data:
-                if c == ":":
-                    break
-                i += 1
-
-            level: str = data[:i]
-            message: str = data[i + 1:]
-
-            if message != "" and message[0] == " ":
-                message = message[1:]
-
-            if data[:5] == "ERROR":
-                return f"[ALERT] {level} level detected: {message}"
-            elif data[:4] == "INFO":
-                return f"[INFO] {level} level detected: {message}"
-            elif data[:4] == "WARN":
-                return f"[WARN] {level} level detected: {message}"
-            else:
-                return "ERROR"
+            return self.process_raw(data).render()
 
         except ValueError as e:
             print(e)
             return "ERROR"
 
+    def process_raw(self, data: Any) -> LogRecord:
+        """
+        Parse a log entry into a record.
+
+        Args:
+            data (Any): The log string to parse.
+
+        Returns:
+            LogRecord: Level, message and alert tag of the entry.
+
+        Raises:
+            ValueError: If the data is invalid.
+        """
+        if not self.validate(data):
+            raise ValueError("Invalid Data")
+        if type(data) is not str:
+            match = self._bytes_pattern.match(data)
+            level: str = match.group(1).decode("ascii")
+            return LogRecord(
+                level, memoryview(data)[match.end():], self.levels[level]
+            )
+        level, message = self._pattern.match(data).groups()
+        return LogRecord(level, message, self.levels[level])
+
+    def process_many(
+        self, lines: Iterable[Any], formatted: bool = False
+    ) -> list[Any]:
+        """
+        Parse many log lines, skipping the invalid ones.
+
+        str lines and byte buffers are both accepted, buffers give
+        records whose message is a memoryview, as in `process_raw`.
+
+        Args:
+            lines (Iterable[Any]): The log lines to parse.
+            formatted (bool): Return formatted alert strings instead
+            of LogRecord records.
+
+        Returns:
+            list[Any]: Parsed records or formatted strings.
+        """
+        match = self._pattern.match
+        match_bytes = self._bytes_pattern.match
+        levels: dict[str, str] = self.levels
+        records: list[LogRecord] = []
+        append = records.append
+        for line in lines:
+            if type(line) is str:
+                found = match(line)
+                if found:
+                    level, message = found.groups()
+                    append(LogRecord(level, message, levels[level]))
+            elif _is_buffer(line):
+                found = match_bytes(line)
+                if found:
+                    level = found.group(1).decode("ascii")
+                    append(LogRecord(
+                        level, memoryview(line)[found.end():], levels[level]
+                    ))
+        if formatted:
+            return [record.render() for record in records]
+        return records
+
+
+_worker_processors: list[DataProcessor] = []
+
+
+def _init_worker(processors: list[DataProcessor]) -> None:
+    """
+    Install the processors shared by every job of a worker process.
+
+    Args:
+        processors (list[DataProcessor]): Processors, indexed by job.
+    """
+    _worker_processors[:] = processors
+
+
+def _run_job(job: tuple[int, Any]) -> str:
+    """
+    Run one job inside a worker process.
+
+    Args:
+        job (tuple[int, Any]): Processor index and payload.
+
+    Returns:
+        str: The processing result.
+    """
+    index, payload = job
+    return _worker_processors[index].process(payload)
+
+
+def _payload_size(payload: Any) -> int:
+    """
+    Estimate the size of a payload.
+
+    Args:
+        payload (Any): The payload to measure.
+
+    Returns:
+        int: Its length, or 1 when it has none.
+    """
+    try:
+        return len(payload)
+    except TypeError:
+        return 1
+
+
+class ProcessorExecutor:
+    """
+    Dispatch (DataProcessor, payload) jobs across a process pool.
+
+    Each distinct processor is pickled once per worker through the pool
+    initializer, jobs only carry an index and their payload. Payloads
+    smaller than `min_payload` run in the calling process, where IPC
+    would cost more than the work itself.
+    """
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        min_payload: int = 50_000,
+        chunksize: int = 1,
+    ):
+        """
+        Initialize the ProcessorExecutor.
+
+        Args:
+            max_workers (int | None): Pool size, defaults to CPU count.
+            min_payload (int): Smallest payload length sent to the pool.
+            chunksize (int): Jobs sent to a worker per round trip.
+        """
+        self.max_workers: int | None = max_workers
+        self.min_payload: int = min_payload
+        self.chunksize: int = chunksize
+
+    def run(self, jobs: Iterable[tuple[DataProcessor, Any]]) -> list[str]:
+        """
+        Process every job and return the results in job order.
+
+        Args:
+            jobs (Iterable[tuple[DataProcessor, Any]]): The jobs to run.
+
+        Returns:
+            list[str]: One result per job, in the same order.
+        """
+        pending: list[tuple[DataProcessor, Any]] = list(jobs)
+        results: list[str] = [""] * len(pending)
+        processors: list[DataProcessor] = []
+        indexes: dict[int, int] = {}
+        local: list[int] = []
+        remote: list[int] = []
+        tasks: list[tuple[int, Any]] = []
+
+        for pos, (processor, payload) in enumerate(pending):
+            if _payload_size(payload) < self.min_payload:
+                local.append(pos)
+                continue
+            if id(processor) not in indexes:
+                indexes[id(processor)] = len(processors)
+                processors.append(processor)
+            remote.append(pos)
+            tasks.append((indexes[id(processor)], payload))
+
+        pool: ProcessPoolExecutor | None = None
+        remote_results: Iterable[str] = []
+        if tasks:
+            pool = ProcessPoolExecutor(
+                self.max_workers,
+                initializer=_init_worker,
+                initargs=(processors,),
+            )
+            remote_results = pool.map(
+                _run_job, tasks, chunksize=self.chunksize
+            )
+
+        try:
+            for pos in local:
+                processor, payload = pending[pos]
+                results[pos] = processor.process(payload)
+            for pos, result in zip(remote, remote_results):
+                results[pos] = result
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        return results
+
+
+class AsyncDataProcessor:
+    """
+    Asyncio adapter around a synchronous DataProcessor.
+
+    Small payloads are processed inline, payloads of at least
+    `offload_threshold` elements run in an executor so the event loop
+    never stalls on a large batch. Errors are returned as "ERROR"
+    instead of being printed.
+    """
+    def __init__(
+        self,
+        processor: DataProcessor,
+        executor: Executor | None = None,
+        offload_threshold: int = 10_000,
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            processor (DataProcessor): The wrapped processor.
+            executor (Executor | None): Executor for large payloads,
+            the loop's default executor if omitted.
+            offload_threshold (int): Smallest payload length offloaded.
+        """
+        self.processor: DataProcessor = processor
+        self.executor: Executor | None = executor
+        self.offload_threshold: int = offload_threshold
+
+    async def process(self, data: Any) -> str:
+        """
+        Process a payload without blocking the event loop.
+
+        Args:
+            data (Any): The payload to process.
+
+        Returns:
+            str: The rendered result, or "ERROR" for invalid data.
+        """
+        if _payload_size(data) < self.offload_threshold:
+            return _render_quiet(self.processor, data)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, _render_quiet, self.processor, data
+        )
+
+
+def _render_quiet(processor: DataProcessor, data: Any) -> str:
+    """
+    Process a payload, turning invalid data into "ERROR" silently.
+
+    Args:
+        processor (DataProcessor): The processor to use.
+        data (Any): The payload to process.
+
+    Returns:
+        str: The rendered result or "ERROR".
+    """
+    try:
+        return processor.process_raw(data).render()
+    except ValueError:
+        return "ERROR"
+
+
+class AsyncPipeline:
+    """
+    Bounded-queue asyncio runner for an AsyncDataProcessor.
+
+    A producer pulls payloads from the source into a queue, and at most
+    `maxsize` payloads are in flight between the source and the caller,
+    so a fast source or one slow payload holding up ordered output
+    waits instead of filling memory. `concurrency` workers process
+    payloads and results are yielded in source order.
+    """
+    def __init__(
+        self,
+        processor: AsyncDataProcessor,
+        concurrency: int = 4,
+        maxsize: int = 64,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            processor (AsyncDataProcessor): The processor to run.
+            concurrency (int): Number of concurrent workers.
+            maxsize (int): Payloads in flight, from the source to the
+            yielded result.
+        """
+        self.processor: AsyncDataProcessor = processor
+        self.concurrency: int = concurrency
+        self.maxsize: int = maxsize
+
+    async def run(self, source: Any) -> AsyncIterator[str]:
+        """
+        Process every payload of a source.
+
+        Invalid payloads yield "ERROR". Any other exception raised
+        while processing a payload stops the run: the producer and the
+        workers are cancelled and the exception is re-raised here.
+
+        Args:
+            source (Any): Iterable or async iterable of payloads.
+
+        Returns:
+            AsyncIterator[str]: The results, in source order.
+
+        Raises:
+            Exception: The first error raised by the processor.
+        """
+        inbox: asyncio.Queue = asyncio.Queue(self.maxsize)
+        outbox: asyncio.Queue = asyncio.Queue(self.maxsize)
+        in_flight: asyncio.Semaphore = asyncio.Semaphore(self.maxsize)
+        producer = asyncio.create_task(
+            self._produce(source, inbox, in_flight)
+        )
+        workers: list[asyncio.Task] = [
+            asyncio.create_task(self._work(inbox, outbox))
+            for _ in range(self.concurrency)
+        ]
+        pending: dict[int, str] = {}
+        expected: int = 0
+        running: int = self.concurrency
+        try:
+            while running:
+                item: tuple[int, str | Exception] | None = (
+                    await outbox.get()
+                )
+                if item is None:
+                    running -= 1
+                    continue
+                if isinstance(item[1], Exception):
+                    raise item[1]
+                pending[item[0]] = item[1]
+                while expected in pending:
+                    yield pending.pop(expected)
+                    expected += 1
+                    in_flight.release()
+            await asyncio.gather(*workers)
+            await producer
+        finally:
+            for task in [producer, *workers]:
+                task.cancel()
+
+    async def _produce(
+        self,
+        source: Any,
+        inbox: asyncio.Queue,
+        in_flight: asyncio.Semaphore,
+    ) -> None:
+        """
+        Feed the input queue, then one stop marker per worker.
+
+        Args:
+            source (Any): Iterable or async iterable of payloads.
+            inbox (asyncio.Queue): The input queue.
+            in_flight (asyncio.Semaphore): Acquired per payload,
+            released once its result is yielded.
+        """
+        index: int = 0
+        try:
+            if hasattr(source, "__aiter__"):
+                async for data in source:
+                    await in_flight.acquire()
+                    await inbox.put((index, data))
+                    index += 1
+            else:
+                for data in source:
+                    await in_flight.acquire()
+                    await inbox.put((index, data))
+                    index += 1
+        finally:
+            for _ in range(self.concurrency):
+                await inbox.put(None)
+
+    async def _work(
+        self, inbox: asyncio.Queue, outbox: asyncio.Queue
+    ) -> None:
+        """
+        Process payloads until the stop marker arrives.
+
+        An exception raised by the processor is sent as the result of
+        its payload and ends the worker.
+
+        Args:
+            inbox (asyncio.Queue): The input queue.
+            outbox (asyncio.Queue): The result queue.
+        """
+        try:
+            while True:
+                item: tuple[int, Any] | None = await inbox.get()
+                if item is None:
+                    return
+                try:
+                    result: str = await self.processor.process(item[1])
+                except Exception as error:
+                    await outbox.put((item[0], error))
+                    return
+                await outbox.put((item[0], result))
+        finally:
+            await outbox.put(None)
+
 
 def main() -> None:
     print("=== CODE NEXUS - DATA PROCESSOR FOUNDATION ===")
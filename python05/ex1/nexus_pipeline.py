@@ -1,5 +1,1008 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Union, Optional
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from os import replace
+from struct import Struct
+from sys import byteorder
+from threading import Event, Lock, Thread, current_thread, local
+from functools import lru_cache
+from itertools import compress, count, islice, repeat, tee
+from math import fsum
+from operator import contains, itemgetter
+from re import compile as re_compile
+from time import perf_counter, time
+from zlib import crc32
+from typing import (
+    Any, AsyncIterator, Callable, Deque, Iterable, Iterator, List, Dict,
+    Tuple, Union, Optional
+)
+
+
+class Aggregate:
+    """
+    Running count, sum, min and max of a single window.
+    """
+    __slots__ = ("count", "total", "low", "high", "start", "end")
+
+    def __init__(self, start: float):
+        """
+        Initialize an empty aggregate.
+
+        Args:
+            start (float): Timestamp of the first value.
+        """
+        self.count: int = 0
+        self.total: float = 0.0
+        self.low: float = float("inf")
+        self.high: float = float("-inf")
+        self.start: float = start
+        self.end: float = start
+
+    def add(self, value: float, timestamp: float) -> None:
+        """
+        Add a value to the aggregate.
+
+        Args:
+            value (float): The value to add.
+            timestamp (float): When the value was seen.
+        """
+        self.count += 1
+        self.total += value
+        if value < self.low:
+            self.low = value
+        if value > self.high:
+            self.high = value
+        self.end = timestamp
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Return the aggregate as a statistics dictionary.
+
+        Returns:
+            Dict[str, float]: count, sum, mean, min, max, start, end.
+        """
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.low if self.count else 0.0,
+            "max": self.high if self.count else 0.0,
+            "start": self.start,
+            "end": self.end,
+        }
+
+
+class Window(ABC):
+    """
+    Abstract base class for windowed aggregations over a stream.
+
+    Every window keeps sum, mean, min and max with O(1) work per value.
+    """
+    @abstractmethod
+    def add(self, value: float, timestamp: float) -> None:
+        """
+        Add a value to the window.
+
+        Args:
+            value (float): The value to add.
+            timestamp (float): When the value was seen.
+        """
+        pass
+
+    @abstractmethod
+    def stats(self, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Return the statistics of the current window.
+
+        Args:
+            now (Optional[float]): Query time, defaults to time().
+
+        Returns:
+            Dict[str, float]: count, sum, mean, min, max, start, end.
+        """
+        pass
+
+
+class SlidingWindow(Window):
+    """
+    Window over the last `size` values and/or the last `duration` seconds.
+
+    Values sit in a ring buffer, min and max in monotonic deques, so
+    expiring a value is as cheap as adding one.
+    """
+    def __init__(
+        self, size: Optional[int] = None, duration: Optional[float] = None
+    ):
+        """
+        Initialize the SlidingWindow.
+
+        Args:
+            size (Optional[int]): Maximum number of values kept.
+            duration (Optional[float]): Maximum value age in seconds.
+        """
+        if size is None and duration is None:
+            raise ValueError("SlidingWindow needs a size or a duration")
+        self.size: Optional[int] = size
+        self.duration: Optional[float] = duration
+        self.values: Deque[Tuple[int, float, float]] = deque()
+        self._low: Deque[Tuple[int, float]] = deque()
+        self._high: Deque[Tuple[int, float]] = deque()
+        self._total: float = 0.0
+        self._seq: int = 0
+
+    def add(self, value: float, timestamp: float) -> None:
+        """
+        Add a value and expire what falls out of the window.
+
+        Args:
+            value (float): The value to add.
+            timestamp (float): When the value was seen.
+        """
+        seq: int = self._seq
+        self._seq += 1
+        self.values.append((seq, timestamp, value))
+        self._total += value
+        while self._low and self._low[-1][1] >= value:
+            self._low.pop()
+        self._low.append((seq, value))
+        while self._high and self._high[-1][1] <= value:
+            self._high.pop()
+        self._high.append((seq, value))
+        self._expire(timestamp)
+
+    def _expire(self, now: float) -> None:
+        """
+        Drop the values that are too old or beyond the size limit.
+
+        Args:
+            now (float): Current time.
+        """
+        values = self.values
+        while values and (
+            (self.size is not None and len(values) > self.size)
+            or (self.duration is not None
+                and values[0][1] <= now - self.duration)
+        ):
+            seq, _, value = values.popleft()
+            self._total -= value
+            if self._low[0][0] == seq:
+                self._low.popleft()
+            if self._high[0][0] == seq:
+                self._high.popleft()
+        if not values:
+            self._total = 0.0
+
+    def stats(self, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Return the statistics of the values still in the window.
+
+        Args:
+            now (Optional[float]): Query time, defaults to time().
+
+        Returns:
+            Dict[str, float]: count, sum, mean, min, max, start, end.
+        """
+        if self.duration is not None:
+            self._expire(time() if now is None else now)
+        count: int = len(self.values)
+        if not count:
+            return Aggregate(0.0).as_dict()
+        return {
+            "count": count,
+            "sum": self._total,
+            "mean": self._total / count,
+            "min": self._low[0][1],
+            "max": self._high[0][1],
+            "start": self.values[0][1],
+            "end": self.values[-1][1],
+        }
+
+
+class TumblingWindow(Window):
+    """
+    Back-to-back windows of `size` values or `duration` seconds.
+
+    Only the open window is aggregated, closed ones are kept in a ring
+    of the last `history` results.
+    """
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        duration: Optional[float] = None,
+        history: int = 16,
+    ):
+        """
+        Initialize the TumblingWindow.
+
+        Args:
+            size (Optional[int]): Number of values per window.
+            duration (Optional[float]): Length of a window in seconds.
+            history (int): Number of closed windows kept.
+        """
+        if size is None and duration is None:
+            raise ValueError("TumblingWindow needs a size or a duration")
+        self.size: Optional[int] = size
+        self.duration: Optional[float] = duration
+        self.closed: Deque[Dict[str, float]] = deque(maxlen=history)
+        self.current: Optional[Aggregate] = None
+
+    def add(self, value: float, timestamp: float) -> None:
+        """
+        Add a value, closing the open window first if it is complete.
+
+        Args:
+            value (float): The value to add.
+            timestamp (float): When the value was seen.
+        """
+        current: Optional[Aggregate] = self.current
+        if current is not None and (
+            (self.size is not None and current.count >= self.size)
+            or (self.duration is not None
+                and timestamp >= current.start + self.duration)
+        ):
+            self.closed.append(current.as_dict())
+            current = None
+        if current is None:
+            start: float = timestamp
+            if self.duration is not None:
+                start -= timestamp % self.duration
+            current = self.current = Aggregate(start)
+        current.add(value, timestamp)
+
+    def stats(self, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Return the statistics of the open window.
+
+        Args:
+            now (Optional[float]): Unused, windows close on add.
+
+        Returns:
+            Dict[str, float]: count, sum, mean, min, max, start, end.
+        """
+        if self.current is None:
+            return Aggregate(0.0).as_dict()
+        return self.current.as_dict()
+
+
+class SessionWindow(Window):
+    """
+    Windows of activity separated by more than `gap` seconds of silence.
+    """
+    def __init__(self, gap: float, history: int = 16):
+        """
+        Initialize the SessionWindow.
+
+        Args:
+            gap (float): Inactivity in seconds that closes a session.
+            history (int): Number of closed sessions kept.
+        """
+        self.gap: float = gap
+        self.closed: Deque[Dict[str, float]] = deque(maxlen=history)
+        self.current: Optional[Aggregate] = None
+
+    def add(self, value: float, timestamp: float) -> None:
+        """
+        Add a value, starting a new session after a long gap.
+
+        Args:
+            value (float): The value to add.
+            timestamp (float): When the value was seen.
+        """
+        current: Optional[Aggregate] = self.current
+        if current is not None and timestamp - current.end > self.gap:
+            self.closed.append(current.as_dict())
+            current = None
+        if current is None:
+            current = self.current = Aggregate(timestamp)
+        current.add(value, timestamp)
+
+    def stats(self, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Return the statistics of the current session.
+
+        Args:
+            now (Optional[float]): Unused, sessions close on add.
+
+        Returns:
+            Dict[str, float]: count, sum, mean, min, max, start, end.
+        """
+        if self.current is None:
+            return Aggregate(0.0).as_dict()
+        return self.current.as_dict()
+
+
+class Filter:
+    """
+    Compiled predicate used to filter stream elements.
+
+    A filter is a `mask` function turning a batch into an iterator of
+    truthy/falsy flags, one per element, built from C-level calls
+    (`map` over `operator.contains`, `str.startswith`, a compiled
+    regex) wherever the kind allows. Build filters with the cached
+    factories below so a filter reused across batches is compiled
+    only once.
+    """
+    __slots__ = ("kind", "argument", "mask")
+
+    def __init__(
+        self,
+        kind: str,
+        argument: Any,
+        mask: Callable[[Iterable[Any]], Iterator[Any]],
+    ):
+        """
+        Initialize the Filter.
+
+        Args:
+            kind (str): Filter kind, for display.
+            argument (Any): The value the filter was built from.
+            mask (Callable[[Iterable[Any]], Iterator[Any]]): Returns
+            one truthy flag per element to keep.
+        """
+        self.kind: str = kind
+        self.argument: Any = argument
+        self.mask: Callable[[Iterable[Any]], Iterator[Any]] = mask
+
+    def __repr__(self) -> str:
+        """
+        Return a readable representation of the filter.
+
+        Returns:
+            str: e.g. "Filter(prefix, 'temp')".
+        """
+        return f"Filter({self.kind}, {self.argument!r})"
+
+
+@lru_cache(maxsize=256)
+def contains_filter(text: str) -> Filter:
+    """
+    Keep elements containing a substring.
+
+    Args:
+        text (str): The substring to look for.
+
+    Returns:
+        Filter: The compiled filter.
+    """
+    return Filter(
+        "contains", text, lambda batch: map(contains, batch, repeat(text))
+    )
+
+
+@lru_cache(maxsize=256)
+def prefix_filter(prefix: str) -> Filter:
+    """
+    Keep elements starting with a prefix.
+
+    Args:
+        prefix (str): The prefix to look for.
+
+    Returns:
+        Filter: The compiled filter.
+    """
+    return Filter(
+        "prefix",
+        prefix,
+        lambda batch: map(str.startswith, batch, repeat(prefix)),
+    )
+
+
+@lru_cache(maxsize=256)
+def regex_filter(pattern: str) -> Filter:
+    """
+    Keep elements matching a regular expression anywhere.
+
+    Args:
+        pattern (str): The regular expression.
+
+    Returns:
+        Filter: The compiled filter.
+    """
+    search: Callable[[str], Any] = re_compile(pattern).search
+    return Filter("regex", pattern, lambda batch: map(search, batch))
+
+
+@lru_cache(maxsize=256)
+def range_filter(low: float, high: float) -> Filter:
+    """
+    Keep 'key:value' elements whose value lies in [low, high].
+
+    The value has to be parsed, so this is the one filter that runs
+    Python code per element.
+
+    Args:
+        low (float): Lowest accepted value.
+        high (float): Highest accepted value.
+
+    Returns:
+        Filter: The compiled filter.
+    """
+    def in_range(element: str) -> bool:
+        try:
+            value: float = float(element.rpartition(":")[2])
+        except ValueError:
+            return False
+        return low <= value <= high
+
+    return Filter("range", (low, high), lambda batch: map(in_range, batch))
+
+
+@lru_cache(maxsize=256)
+def membership_filter(*keys: str) -> Filter:
+    """
+    Keep elements whose key (text before ':') is one of `keys`.
+
+    Args:
+        *keys (str): The accepted keys.
+
+    Returns:
+        Filter: The compiled filter.
+    """
+    prefixes: Tuple[str, ...] = tuple(
+        f"{key}:" for key in keys if ":" not in key
+    )
+    return Filter(
+        "membership",
+        keys,
+        lambda batch: map(str.startswith, batch, repeat(prefixes)),
+    )
+
+
+def compile_filter(criteria: Union[str, Filter]) -> Filter:
+    """
+    Turn filter criteria into a compiled Filter.
+
+    Args:
+        criteria (Union[str, Filter]): A substring or a Filter.
+
+    Returns:
+        Filter: The compiled filter.
+    """
+    if isinstance(criteria, Filter):
+        return criteria
+    return contains_filter(criteria)
+
+
+HEADER: Struct = Struct("<4sHQQ")
+MAGIC: bytes = b"NXCP"
+VERSION: int = 2
+SENSOR_STATE: Struct = Struct("<dQI")
+METRIC_STATE: Struct = Struct("<Qddd")
+TRANSACTION_STATE: Struct = Struct("<qQdI")
+LEDGER_ENTRY: Struct = Struct("<q")
+EVENT_STATE: Struct = Struct("<QI")
+HEAVY_ENTRY: Struct = Struct("<QQ")
+SKETCH_SHAPE: Struct = Struct("<II")
+
+
+def pack_str(text: str) -> bytes:
+    """
+    Pack a string as a length-prefixed UTF-8 field.
+
+    Args:
+        text (str): The string to pack.
+
+    Returns:
+        bytes: The packed field.
+    """
+    raw: bytes = text.encode("utf-8")
+    return len(raw).to_bytes(4, "little") + raw
+
+
+class SnapshotReader:
+    """
+    Sequential reader over a packed checkpoint.
+    """
+    def __init__(self, data: bytes):
+        """
+        Initialize the reader at the start of the snapshot.
+
+        Args:
+            data (bytes): The packed snapshot.
+        """
+        self.data: bytes = data
+        self.offset: int = 0
+
+    def read(self, layout: Struct) -> Tuple[Any, ...]:
+        """
+        Unpack the next fixed-size record.
+
+        Args:
+            layout (Struct): The record layout.
+
+        Returns:
+            Tuple[Any, ...]: The unpacked fields.
+        """
+        fields: Tuple[Any, ...] = layout.unpack_from(self.data, self.offset)
+        self.offset += layout.size
+        return fields
+
+    def read_str(self) -> str:
+        """
+        Unpack the next length-prefixed string.
+
+        Returns:
+            str: The string.
+        """
+        size: int = int.from_bytes(
+            self.data[self.offset:self.offset + 4], "little"
+        )
+        start: int = self.offset + 4
+        self.offset = start + size
+        return self.data[start:self.offset].decode("utf-8")
+
+    def read_array(self, typecode: str, size: int) -> array:
+        """
+        Unpack the next little-endian array of `size` items.
+
+        Args:
+            typecode (str): The array item type.
+            size (int): Number of items.
+
+        Returns:
+            array: The array.
+        """
+        items: array = array(typecode)
+        start: int = self.offset
+        self.offset = start + size * items.itemsize
+        items.frombytes(self.data[start:self.offset])
+        if byteorder == "big":
+            items.byteswap()
+        return items
+
+
+class Checkpointer:
+    """
+    Writes stream snapshots to disk every N batches or T seconds.
+
+    Snapshots are packed on the ingest thread, which is cheap, and
+    written by a background thread with an atomic rename. If a write is
+    still pending, the newer snapshot replaces it, so ingest never waits
+    for the disk. A failed write is counted in `failures` and kept in
+    `last_error`; the writer keeps running and the next snapshot
+    retries.
+    """
+    def __init__(
+        self, path: str, every_batches: int = 100, every_seconds: float = 30.0
+    ):
+        """
+        Initialize the Checkpointer and start its writer thread.
+
+        Args:
+            path (str): Checkpoint file path.
+            every_batches (int): Batches between two snapshots.
+            every_seconds (float): Seconds between two snapshots.
+        """
+        self.path: str = path
+        self.every_batches: int = every_batches
+        self.every_seconds: float = every_seconds
+        self.written: int = 0
+        self.failures: int = 0
+        self.last_error: Optional[OSError] = None
+        self._batches: int = 0
+        self._last: float = perf_counter()
+        self._pending: Optional[bytes] = None
+        self._lock: Lock = Lock()
+        self._wake: Event = Event()
+        self._closed: bool = False
+        self._thread: Thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def maybe_save(self, stream: "DataStream") -> None:
+        """
+        Queue a snapshot of the stream if one is due.
+
+        Args:
+            stream (DataStream): The stream that finished a batch.
+        """
+        self._batches += 1
+        now: float = perf_counter()
+        if (self._batches < self.every_batches
+                and now - self._last < self.every_seconds):
+            return
+        self._batches = 0
+        self._last = now
+        self.save(stream.to_bytes())
+
+    def save(self, snapshot: bytes) -> None:
+        """
+        Hand a snapshot to the writer thread.
+
+        Args:
+            snapshot (bytes): The packed stream state.
+        """
+        with self._lock:
+            self._pending = snapshot
+        self._wake.set()
+
+    def close(self, stream: Optional["DataStream"] = None) -> None:
+        """
+        Write the pending snapshot and stop the writer thread.
+
+        Args:
+            stream (Optional[DataStream]): Stream to snapshot one last
+            time before closing.
+
+        Raises:
+            OSError: If the last write failed, so the file on disk is
+            older than the stream.
+        """
+        if stream is not None:
+            self.save(stream.to_bytes())
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        if self.last_error is not None:
+            raise self.last_error
+
+    def _run(self) -> None:
+        """
+        Writer loop, writes the latest snapshot on every wake-up.
+
+        It exits once closed with no snapshot left, so a snapshot saved
+        while an earlier one is being written is still written.
+        """
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            with self._lock:
+                snapshot: Optional[bytes] = self._pending
+                self._pending = None
+            if snapshot is not None:
+                try:
+                    self._write(snapshot)
+                except OSError as error:
+                    self.failures += 1
+                    self.last_error = error
+                else:
+                    self.last_error = None
+            with self._lock:
+                if self._closed and self._pending is None:
+                    return
+
+    def _write(self, snapshot: bytes) -> None:
+        """
+        Atomically replace the checkpoint file.
+
+        Args:
+            snapshot (bytes): The packed stream state.
+        """
+        temporary: str = self.path + ".tmp"
+        with open(temporary, "wb") as file:
+            file.write(snapshot)
+        replace(temporary, self.path)
+        self.written += 1
+
+
+class LogHistogram:
+    """
+    HDR-style histogram of non-negative integers.
+
+    Values below 32 get their own bucket, larger ones fall in one of 16
+    linear sub-buckets per power of two, so every bucket is within ~6%
+    of the values it holds and recording is O(1).
+    """
+    __slots__ = ("counts", "count", "total", "maximum")
+
+    def __init__(self):
+        """
+        Initialize an empty histogram.
+        """
+        self.counts: List[int] = []
+        self.count: int = 0
+        self.total: int = 0
+        self.maximum: int = 0
+
+    @staticmethod
+    def bucket(value: int) -> int:
+        """
+        Return the bucket index of a value.
+
+        Args:
+            value (int): A non-negative integer.
+
+        Returns:
+            int: The bucket index.
+        """
+        if value < 32:
+            return value
+        shift: int = value.bit_length() - 5
+        return (shift << 4) + (value >> shift)
+
+    @staticmethod
+    def upper_bound(index: int) -> int:
+        """
+        Return the highest value a bucket holds.
+
+        Args:
+            index (int): The bucket index.
+
+        Returns:
+            int: The largest value mapped to that bucket.
+        """
+        if index < 32:
+            return index
+        shift: int = (index >> 4) - 1
+        return ((index - (shift << 4) + 1) << shift) - 1
+
+    def record(self, value: int, times: int = 1) -> None:
+        """
+        Record a value.
+
+        Args:
+            value (int): A non-negative integer.
+            times (int): How many times the value was seen.
+        """
+        index: int = self.bucket(value)
+        counts: List[int] = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += times
+        self.count += times
+        self.total += value * times
+        if value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other: "LogHistogram") -> "LogHistogram":
+        """
+        Add the values of another histogram to this one.
+
+        Args:
+            other (LogHistogram): The histogram to add.
+
+        Returns:
+            LogHistogram: This histogram, updated.
+        """
+        counts: List[int] = self.counts
+        if len(other.counts) > len(counts):
+            counts.extend([0] * (len(other.counts) - len(counts)))
+        for index, amount in enumerate(other.counts):
+            counts[index] += amount
+        self.count += other.count
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    def percentile(self, percent: float) -> int:
+        """
+        Return the value below which `percent` of the values fall.
+
+        Args:
+            percent (float): Percentile between 0 and 100.
+
+        Returns:
+            int: Upper bound of the matching bucket, 0 when empty.
+        """
+        if not self.count:
+            return 0
+        rank: float = self.count * percent / 100
+        seen: int = 0
+        for index, amount in enumerate(self.counts):
+            seen += amount
+            if amount and seen >= rank:
+                return min(self.upper_bound(index), self.maximum)
+        return self.maximum
+
+    def mean(self) -> float:
+        """
+        Return the mean of the recorded values.
+
+        Returns:
+            float: The exact mean, 0.0 when empty.
+        """
+        return self.total / self.count if self.count else 0.0
+
+
+class MetricsReporter:
+    """
+    Background thread handing periodic statistics to a sink.
+    """
+    def __init__(
+        self,
+        source: Callable[[], Any],
+        interval: float = 10.0,
+        sink: Callable[[Any], None] = print,
+    ):
+        """
+        Initialize the reporter, call `start` to run it.
+
+        Args:
+            source (Callable[[], Any]): Returns the statistics, e.g. a
+            bound get_stats method.
+            interval (float): Seconds between two reports.
+            sink (Callable[[Any], None]): Receives each report.
+        """
+        self.source: Callable[[], Any] = source
+        self.interval: float = interval
+        self.sink: Callable[[Any], None] = sink
+        self._stop: Event = Event()
+        self._thread: Thread = Thread(target=self._run, daemon=True)
+
+    def start(self) -> "MetricsReporter":
+        """
+        Start reporting.
+
+        Returns:
+            MetricsReporter: The reporter itself.
+        """
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop reporting and wait for the thread to exit.
+        """
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        """
+        Report every `interval` seconds until stopped.
+        """
+        while not self._stop.wait(self.interval):
+            self.sink(self.source())
+
+
+class Sharded:
+    """
+    Stream state split into one shard per thread, merged on read.
+
+    Each thread only writes to its own shard dictionary, so concurrent
+    producers need no lock and lose no update. Readers combine a
+    snapshot of every shard. In single-threaded mode there is one
+    shared shard and no thread-local lookup. Shards of exited threads
+    are folded into a single retired shard when a new one is created,
+    so the shard count follows the live threads.
+    """
+    def __init__(
+        self,
+        factory: Callable[[], Dict[str, Any]],
+        thread_safe: bool = False,
+        merge: Optional[Callable[..., None]] = None,
+    ):
+        """
+        Initialize the shards.
+
+        Args:
+            factory (Callable[[], Dict[str, Any]]): Builds an empty shard.
+            thread_safe (bool): Give every thread its own shard.
+            merge (Optional[Callable[..., None]]): Adds a shard into
+            another one, dead thread shards are kept as is if omitted.
+        """
+        self.factory: Callable[[], Dict[str, Any]] = factory
+        self.merge: Optional[Callable[..., None]] = merge
+        self._local: Optional[local] = local() if thread_safe else None
+        self._shards: List[Dict[str, Any]] = [] if thread_safe else [
+            factory()
+        ]
+        self._owners: List[Optional[Thread]] = []
+        self._lock: Lock = Lock()
+
+    def local(self) -> Dict[str, Any]:
+        """
+        Return the shard owned by the calling thread.
+
+        Returns:
+            Dict[str, Any]: The shard to write to.
+        """
+        if self._local is None:
+            return self._shards[0]
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard: Dict[str, Any] = self.factory()
+            with self._lock:
+                self._retire()
+                self._shards = self._shards + [shard]
+                self._owners.append(current_thread())
+            self._local.shard = shard
+            return shard
+
+    def _retire(self) -> None:
+        """
+        Fold the shards of exited threads into the retired shard.
+
+        The retired shard is rebuilt rather than updated in place and
+        the shard list is swapped whole, so a reader holding the old
+        list never counts a value twice. Call with the lock held.
+        """
+        if self.merge is None:
+            return
+        owners: List[Optional[Thread]] = self._owners
+        dead: List[int] = [
+            pos for pos, owner in enumerate(owners)
+            if owner is not None and not owner.is_alive()
+        ]
+        if not dead:
+            return
+        retired: Dict[str, Any] = self.factory()
+        kept: List[Dict[str, Any]] = [retired]
+        kept_owners: List[Optional[Thread]] = [None]
+        for shard, owner in zip(self._shards, owners):
+            if owner is None or not owner.is_alive():
+                self.merge(retired, shard)
+            else:
+                kept.append(shard)
+                kept_owners.append(owner)
+        self._shards = kept
+        self._owners = kept_owners
+
+    def shards(self) -> List[Dict[str, Any]]:
+        """
+        Return a snapshot of every shard.
+
+        Returns:
+            List[Dict[str, Any]]: The shards.
+        """
+        return list(self._shards) or [self.factory()]
+
+    def total(self, key: str) -> Any:
+        """
+        Sum a numeric entry across the shards.
+
+        Args:
+            key (str): The entry to sum.
+
+        Returns:
+            Any: The merged value.
+        """
+        return sum(shard[key] for shard in self.shards())
+
+    def assign(self, key: str, value: Any) -> None:
+        """
+        Set the merged value of an entry, e.g. when restoring state.
+
+        Args:
+            key (str): The entry to set.
+            value (Any): Its new merged value.
+        """
+        for shard in self.shards():
+            shard[key] = self.factory()[key]
+        self.local()[key] = value
+
+
+class ShardedTotal:
+    """
+    Read-only stream attribute summing one state entry across shards.
+    """
+    def __init__(self, key: str):
+        """
+        Initialize the attribute.
+
+        Args:
+            key (str): The state entry to expose.
+        """
+        self.key: str = key
+
+    def __get__(self, stream: Any, owner: type) -> Any:
+        """
+        Return the merged value of the entry.
+
+        Args:
+            stream (Any): The stream instance, None on class access.
+            owner (type): The stream class.
+
+        Returns:
+            Any: The merged value.
+        """
+        if stream is None:
+            return self
+        return stream._state.total(self.key)
+
+    def __set__(self, stream: Any, value: Any) -> None:
+        """
+        Refuse assignment, the total is derived from the shards.
+
+        Args:
+            stream (Any): The stream instance.
+            value (Any): The rejected value.
+
+        Raises:
+            AttributeError: Always.
+        """
+        raise AttributeError(f"{self.key} is read-only")
 
 
 class DataStream(ABC):
@@ -9,16 +1012,65 @@ class DataStream(ABC):
     Each stream must implement batch processing logic while
     optionally using the shared filtering and statistics behavior.
     """
-    def __init__(self, stream_id: str):
+    label: str = "Stream data"
+    unit: str = "elements"
+    total_processed: ShardedTotal = ShardedTotal("total")
+    batches_processed: ShardedTotal = ShardedTotal("batches")
+
+    def __init__(
+        self, stream_id: str, thread_safe: bool = False, sample_every: int = 1
+    ):
         """
         Initialize the DataStream with a stream identifier.
 
         Args:
             stream_id (str): Unique identifier for the stream.
+            thread_safe (bool): Shard the statistics per thread so
+            several threads can feed the same stream.
+            sample_every (int): Time one batch out of `sample_every`.
         """
         self.stream_id: str = stream_id
-        self.total_processed: int = 0
-        self.batches_processed: int = 0
+        self.thread_safe: bool = thread_safe
+        self.sample_every: int = sample_every
+        self._state: Sharded = Sharded(
+            self.new_state, thread_safe, self.merge_state
+        )
+        self.windows: Dict[str, Window] = {}
+        self._windows_lock: Lock = Lock()
+        self.checkpointer: Optional[Checkpointer] = None
+
+    def new_state(self) -> Dict[str, Any]:
+        """
+        Build an empty statistics shard, extended by subclasses.
+
+        Returns:
+            Dict[str, Any]: The counters of one shard.
+        """
+        return {
+            "total": 0,
+            "batches": 0,
+            "latency": LogHistogram(),
+            "sizes": LogHistogram(),
+            "timed_elements": 0,
+            "timed_seconds": 0.0,
+        }
+
+    def merge_state(
+        self, running: Dict[str, Any], shard: Dict[str, Any]
+    ) -> None:
+        """
+        Add the counters of a shard into another, extended by subclasses
+        for their non-numeric entries.
+
+        Args:
+            running (Dict[str, Any]): The shard to update.
+            shard (Dict[str, Any]): The shard to add.
+        """
+        for key, value in shard.items():
+            if isinstance(value, LogHistogram):
+                running[key].merge(value)
+            elif isinstance(value, (int, float)):
+                running[key] += value
 
     @abstractmethod
     def process_batch(self, data_batch: List[Any]) -> str:
@@ -28,41 +1080,404 @@ class DataStream(ABC):
         Args:
             data_batch (List[Any]): The batch of data to process.
 
-        Returns:
-            str: The formatted processing result.
+        Returns:
+            str: The formatted processing result.
+        """
+        pass
+
+    def process_stream(
+        self, source: Iterable[Any], batch_size: int = 1000
+    ) -> Iterator[str]:
+        """
+        Lazily process an iterable in micro-batches.
+
+        Only one batch is held in memory at a time, whatever the
+        length of the source.
+
+        Args:
+            source (Iterable[Any]): Any iterable or iterator of elements.
+            batch_size (int): Elements per micro-batch.
+
+        Returns:
+            Iterator[str]: The result of each micro-batch.
+        """
+        iterator: Iterator[Any] = iter(source)
+        batch: List[Any] = list(islice(iterator, batch_size))
+        while batch:
+            yield self.process_batch(batch)
+            batch = list(islice(iterator, batch_size))
+
+    async def aprocess_stream(
+        self, source: Any, batch_size: int = 1000
+    ) -> AsyncIterator[str]:
+        """
+        Process an async iterable (or a plain iterable) in micro-batches.
+
+        Args:
+            source (Any): Async iterable or iterable of elements.
+            batch_size (int): Elements per micro-batch.
+
+        Returns:
+            AsyncIterator[str]: The result of each micro-batch.
+        """
+        if not hasattr(source, "__aiter__"):
+            for result in self.process_stream(source, batch_size):
+                yield result
+            return
+
+        batch: List[Any] = []
+        async for element in source:
+            batch.append(element)
+            if len(batch) >= batch_size:
+                yield self.process_batch(batch)
+                batch = []
+        if batch:
+            yield self.process_batch(batch)
+
+    def filter_data(
+        self,
+        data_batch: List[Any],
+        criteria: Optional[Union[str, Filter]] = None,
+    ) -> List[Any]:
+        """
+        Filter data based on an optional criteria string or Filter.
+
+        Args:
+            data_batch (List[Any]): The batch of data to filter.
+            criteria (Optional[Union[str, Filter]]): A substring or a
+            compiled Filter.
+
+        Returns:
+            List[Any]: Filtered list of data elements.
+        """
+        if criteria is None:
+            return data_batch
+        if type(criteria) is str:
+            return [element for element in data_batch if criteria in element]
+        return list(compress(data_batch, criteria.mask(data_batch)))
+
+    def iter_filter(
+        self, data_batch: Iterable[Any], criteria: Union[str, Filter]
+    ) -> Iterator[Any]:
+        """
+        Lazily yield the elements matching the criteria.
+
+        Args:
+            data_batch (Iterable[Any]): The batch of data to filter.
+            criteria (Union[str, Filter]): A substring or a Filter.
+
+        Returns:
+            Iterator[Any]: The matching elements, without a copy.
+        """
+        elements, flags = tee(data_batch)
+        return compress(elements, compile_filter(criteria).mask(flags))
+
+    def filter_indices(
+        self, data_batch: Iterable[Any], criteria: Union[str, Filter]
+    ) -> array:
+        """
+        Return the positions of the elements matching the criteria.
+
+        Args:
+            data_batch (Iterable[Any]): The batch of data to filter.
+            criteria (Union[str, Filter]): A substring or a Filter.
+
+        Returns:
+            array: An array('L') of matching indices.
+        """
+        mask: Iterator[Any] = compile_filter(criteria).mask(data_batch)
+        return array("L", compress(count(), mask))
+
+    def get_stats(self) -> Dict[str, Union[str, int, float]]:
+        """
+        Return stream statistics.
+
+        Rate, latency and batch size figures cover the timed batches
+        only, one out of `sample_every`.
+
+        Returns:
+            Dict[str, Union[str, int, float]]: Dictionary containing
+            stream_id, total_processed, batches_processed,
+            elements_per_sec (elements per second of processing time),
+            latency_us_p50, latency_us_p99 and latency_us_max (batch
+            latency in microseconds), and batch_size_p50,
+            batch_size_mean and batch_size_max (elements per batch).
+        """
+        latency: LogHistogram = self.histogram("latency")
+        sizes: LogHistogram = self.histogram("sizes")
+        seconds: float = self._state.total("timed_seconds")
+        return {
+            "stream_id": self.stream_id,
+            "total_processed": self.total_processed,
+            "batches_processed": self.batches_processed,
+            "elements_per_sec": (
+                self._state.total("timed_elements") / seconds
+                if seconds else 0.0
+            ),
+            "latency_us_p50": latency.percentile(50),
+            "latency_us_p99": latency.percentile(99),
+            "latency_us_max": latency.maximum,
+            "batch_size_p50": sizes.percentile(50),
+            "batch_size_mean": sizes.mean(),
+            "batch_size_max": sizes.maximum,
+        }
+
+    def histogram(self, name: str) -> LogHistogram:
+        """
+        Return a histogram merged across shards.
+
+        Args:
+            name (str): "latency" (microseconds per batch) or "sizes"
+            (elements per batch).
+
+        Returns:
+            LogHistogram: The merged histogram of the timed batches.
+        """
+        merged: LogHistogram = LogHistogram()
+        for shard in self._state.shards():
+            merged.merge(shard[name])
+        return merged
+
+    def start_timer(self) -> Optional[float]:
+        """
+        Start timing a batch if it is sampled.
+
+        Returns:
+            Optional[float]: Start time to give to `record_batch`, None
+            when the batch is not sampled.
+        """
+        if self._state.local()["batches"] % self.sample_every:
+            return None
+        return perf_counter()
+
+    def record_batch(self, size: int, started: Optional[float] = None) -> None:
+        """
+        Account for a processed batch, called at the end of process_batch.
+
+        Args:
+            size (int): Number of elements in the batch.
+            started (Optional[float]): Value from `start_timer`.
+        """
+        state: Dict[str, Any] = self._state.local()
+        state["total"] += size
+        state["batches"] += 1
+        if started is not None:
+            elapsed: float = perf_counter() - started
+            state["latency"].record(int(elapsed * 1_000_000))
+            state["sizes"].record(size)
+            state["timed_elements"] += size
+            state["timed_seconds"] += elapsed
+        if self.checkpointer is not None:
+            self.checkpointer.maybe_save(self)
+
+    def enable_checkpoints(
+        self, path: str, every_batches: int = 100, every_seconds: float = 30.0
+    ) -> Checkpointer:
+        """
+        Periodically snapshot the stream state to a file.
+
+        Args:
+            path (str): Checkpoint file path.
+            every_batches (int): Batches between two snapshots.
+            every_seconds (float): Seconds between two snapshots.
+
+        Returns:
+            Checkpointer: The checkpointer, `close` it on shutdown.
+        """
+        self.checkpointer = Checkpointer(path, every_batches, every_seconds)
+        return self.checkpointer
+
+    def to_bytes(self) -> bytes:
+        """
+        Pack the stream counters into a binary snapshot.
+
+        Windows are not part of the snapshot.
+
+        Returns:
+            bytes: The packed snapshot.
+        """
+        return b"".join((
+            HEADER.pack(
+                MAGIC, VERSION, self.total_processed, self.batches_processed
+            ),
+            pack_str(type(self).__name__),
+            pack_str(self.stream_id),
+            self.pack_state(),
+        ))
+
+    def load_bytes(self, snapshot: bytes) -> None:
+        """
+        Restore the stream counters from a binary snapshot.
+
+        The stream keeps its own `stream_id`, the id stored in the
+        snapshot is skipped.
+
+        Args:
+            snapshot (bytes): A snapshot made by `to_bytes`.
+
+        Raises:
+            ValueError: If the snapshot is not for this stream type.
+        """
+        reader: SnapshotReader = SnapshotReader(snapshot)
+        magic, version, total, batches = reader.read(HEADER)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a stream checkpoint")
+        if reader.read_str() != type(self).__name__:
+            raise ValueError("Checkpoint is for another stream type")
+        reader.read_str()
+        self._state.assign("total", total)
+        self._state.assign("batches", batches)
+        self.unpack_state(reader)
+
+    def restore_checkpoint(self, path: str) -> bool:
+        """
+        Restore the stream from a checkpoint file if there is one.
+
+        Args:
+            path (str): Checkpoint file path.
+
+        Returns:
+            bool: True if a checkpoint was loaded.
+        """
+        try:
+            with open(path, "rb") as file:
+                snapshot: bytes = file.read()
+        except FileNotFoundError:
+            return False
+        self.load_bytes(snapshot)
+        return True
+
+    def pack_state(self) -> bytes:
+        """
+        Pack the state specific to the stream type.
+
+        Returns:
+            bytes: The packed state, empty by default.
+        """
+        return b""
+
+    def unpack_state(self, reader: SnapshotReader) -> None:
+        """
+        Restore the state packed by `pack_state`.
+
+        Args:
+            reader (SnapshotReader): Reader positioned on the state.
+        """
+        pass
+
+    def summary(self) -> str:
+        """
+        Return a one-line progress summary of the stream.
+
+        Returns:
+            str: e.g. 'Sensor data: 4 readings processed'.
+        """
+        return f"{self.label}: {self.total_processed} {self.unit} processed"
+
+    def add_window(self, name: str, window: Window) -> None:
+        """
+        Attach a windowed aggregation to the stream.
+
+        Args:
+            name (str): Name used to query the window.
+            window (Window): The window to feed.
         """
-        pass
+        self.windows[name] = window
 
-    def filter_data(
-        self, data_batch: List[Any], criteria: Optional[str] = None
-    ) -> List[Any]:
+    def window_stats(
+        self, name: str, now: Optional[float] = None
+    ) -> Dict[str, float]:
         """
-        Filter data based on an optional criteria string.
+        Return the statistics of a named window.
 
         Args:
-            data_batch (List[Any]): The batch of data to filter.
-            criteria (Optional[str]): The string criteria to filter by.
+            name (str): The window name.
+            now (Optional[float]): Query time, defaults to time().
 
         Returns:
-            List[Any]: Filtered list of data elements.
+            Dict[str, float]: count, sum, mean, min, max, start, end.
         """
-        if criteria is None:
-            return data_batch
-        return [element for element in data_batch if criteria in element]
+        with self._windows_lock:
+            return self.windows[name].stats(now)
 
-    def get_stats(self) -> Dict[str, Union[str, int, float]]:
+    def feed_windows(
+        self, values: Iterable[float], timestamp: Optional[float] = None
+    ) -> None:
         """
-        Return stream statistics.
+        Feed the values of a batch to every attached window.
 
-        Returns:
-            Dict[str, Union[str, int, float]]: Dictionary containing
-            stream_id, total_processed, and batches_processed.
+        Args:
+            values (Iterable[float]): The values of the batch.
+            timestamp (Optional[float]): Batch time, defaults to time().
         """
-        return {
-            "stream_id": self.stream_id,
-            "total_processed": self.total_processed,
-            "batches_processed": self.batches_processed
-            }
+        if not self.windows:
+            return
+        now: float = time() if timestamp is None else timestamp
+        windows: List[Window] = list(self.windows.values())
+        with self._windows_lock:
+            for value in values:
+                for window in windows:
+                    window.add(value, now)
+
+
+def merge_aggregates(
+    running: Dict[str, Dict[str, float]],
+    aggregates: Dict[str, Dict[str, float]],
+) -> None:
+    """
+    Fold per-metric aggregates into running per-metric statistics.
+
+    Args:
+        running (Dict[str, Dict[str, float]]): Statistics to update.
+        aggregates (Dict[str, Dict[str, float]]): Aggregates to add.
+    """
+    for key, batch in aggregates.items():
+        current: Optional[Dict[str, float]] = running.get(key)
+        if current is None:
+            running[key] = dict(batch)
+            continue
+        current["count"] += batch["count"]
+        current["sum"] += batch["sum"]
+        current["mean"] = current["sum"] / current["count"]
+        current["min"] = min(current["min"], batch["min"])
+        current["max"] = max(current["max"], batch["max"])
+
+
+def parse_column(
+    data_batch: List[Any], prefix: str
+) -> Optional[List[float]]:
+    """
+    Parse a batch where every reading has the same 'key:' prefix.
+
+    The prefix is counted once on the joined batch, then every value
+    is sliced and converted by C-level maps instead of a Python loop.
+    If the count matches but a reading lacks the prefix, some other
+    reading contains ',key:' and its slice keeps that colon, so
+    float() fails and the batch is left to the per-reading loop.
+
+    Args:
+        data_batch (List[Any]): Non-empty list of readings.
+        prefix (str): The key followed by a colon, e.g. 'temp:'.
+
+    Returns:
+        Optional[List[float]]: The values, or None when the batch
+        needs the per-reading loop.
+    """
+    last: Any = data_batch[-1]
+    if type(last) is not str or not last.startswith(prefix):
+        return None
+    try:
+        joined: str = ",".join(data_batch)
+    except TypeError:
+        return None
+    if ("," + joined).count("," + prefix) != len(data_batch):
+        return None
+    try:
+        return list(map(
+            float, map(itemgetter(slice(len(prefix), None)), data_batch)
+        ))
+    except ValueError:
+        return None
 
 
 class SensorStream(DataStream):
@@ -71,18 +1486,70 @@ class SensorStream(DataStream):
 
     Validates sensor readings and computes average temperature
     from batch data containing temp, humidity, and pressure values.
+    Readings are parsed into one float column per metric so every
+    metric is kept and aggregated.
     """
-    def __init__(self, stream_id: str):
+    label: str = "Sensor data"
+    unit: str = "readings"
+    rejected: ShardedTotal = ShardedTotal("rejected")
+
+    def __init__(
+        self, stream_id: str, thread_safe: bool = False, sample_every: int = 1
+    ):
         """
         Initialize the SensorStream with a stream identifier.
 
         Args:
             stream_id (str): Unique identifier for the sensor stream.
+            thread_safe (bool): Shard the statistics per thread.
+            sample_every (int): Time one batch out of `sample_every`.
         """
-        super().__init__(stream_id)
+        super().__init__(stream_id, thread_safe, sample_every)
         self.stream_type: str = "Environmental Data"
         self.temp: float = 0.0
 
+    def new_state(self) -> Dict[str, Any]:
+        """
+        Build an empty statistics shard.
+
+        Returns:
+            Dict[str, Any]: Base counters, rejected and metrics.
+        """
+        state: Dict[str, Any] = super().new_state()
+        state["rejected"] = 0
+        state["metrics"] = {}
+        return state
+
+    def merge_state(
+        self, running: Dict[str, Any], shard: Dict[str, Any]
+    ) -> None:
+        """
+        Add the counters and per-metric statistics of a shard.
+
+        Args:
+            running (Dict[str, Any]): The shard to update.
+            shard (Dict[str, Any]): The shard to add.
+        """
+        super().merge_state(running, shard)
+        merge_aggregates(running["metrics"], shard["metrics"])
+
+    @property
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Running per-metric aggregates merged across shards.
+
+        Returns:
+            Dict[str, Dict[str, float]]: count, sum, mean, min and max
+            of every metric.
+        """
+        shards: List[Dict[str, Any]] = self._state.shards()
+        if len(shards) == 1:
+            return shards[0]["metrics"]
+        merged: Dict[str, Dict[str, float]] = {}
+        for shard in shards:
+            merge_aggregates(merged, dict(shard["metrics"]))
+        return merged
+
     def process_batch(self, data_batch: List[Any]) -> str:
         """
         Process a batch of sensor readings and compute average temperature.
@@ -93,39 +1560,311 @@ class SensorStream(DataStream):
         Returns:
             str: Formatted sensor analysis result.
         """
-        temps: List[float] = []
-        for elem in data_batch:
-            if "temp" in elem:
-                temps.append(float(elem[5:]))
-        if temps:
-            self.temp = sum(temps) / len(temps)
+        started: Optional[float] = self.start_timer()
+        columns: Dict[str, List[float]] = self.ingest_columns(data_batch)
+        aggregates: Dict[str, Dict[str, float]] = self.aggregate(columns)
+        if "temp" in aggregates:
+            self.temp = aggregates["temp"]["mean"]
+            self.feed_windows(columns["temp"])
+        self.merge_metrics(aggregates)
 
-        self.total_processed += len(data_batch)
-        self.batches_processed += 1
+        self.record_batch(len(data_batch), started)
 
         return (
             f"Sensor analysis: {self.total_processed} readings processed, "
             f"avg temp: {self.temp:.1f}°C"
         )
 
+    def ingest_columns(
+        self, data_batch: List[Any]
+    ) -> Dict[str, List[float]]:
+        """
+        Parse 'key:value' readings into one float column per metric.
+
+        Readings without a colon or with a non-numeric value are
+        counted in `rejected` and skipped. Batches holding a single
+        metric, the common case, are parsed by `parse_column` in one
+        pass.
+
+        Args:
+            data_batch (List[Any]): List of sensor readings.
+
+        Returns:
+            Dict[str, List[float]]: The values of every metric.
+        """
+        if not data_batch:
+            return {}
+        if type(data_batch[0]) is str:
+            key: str = data_batch[0].partition(":")[0]
+            column: Optional[List[float]] = parse_column(
+                data_batch, key + ":"
+            )
+            if column is not None:
+                return {key: column}
+
+        columns: Dict[str, List[float]] = {}
+        rejected: int = 0
+        for elem in data_batch:
+            key, _, value = elem.partition(":")
+            try:
+                number: float = float(value)
+            except ValueError:
+                rejected += 1
+                continue
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = []
+            column.append(number)
+        self._state.local()["rejected"] += rejected
+        return columns
+
+    def aggregate(
+        self, columns: Dict[str, List[float]]
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Compute count, sum, mean, min and max of every column.
+
+        Args:
+            columns (Dict[str, List[float]]): Columns from
+                ingest_columns.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Aggregates per metric.
+        """
+        aggregates: Dict[str, Dict[str, float]] = {}
+        for key, column in columns.items():
+            total: float = fsum(column)
+            aggregates[key] = {
+                "count": len(column),
+                "sum": total,
+                "mean": total / len(column),
+                "min": min(column),
+                "max": max(column),
+            }
+        return aggregates
+
+    def merge_metrics(self, aggregates: Dict[str, Dict[str, float]]) -> None:
+        """
+        Fold batch aggregates into the running per-metric statistics.
+
+        Args:
+            aggregates (Dict[str, Dict[str, float]]): Batch aggregates.
+        """
+        merge_aggregates(self._state.local()["metrics"], aggregates)
+
+    def pack_state(self) -> bytes:
+        """
+        Pack temperature, rejected count and per-metric aggregates.
+
+        Returns:
+            bytes: The packed state.
+        """
+        parts: List[bytes] = [
+            SENSOR_STATE.pack(self.temp, self.rejected, len(self.metrics))
+        ]
+        for key, metric in self.metrics.items():
+            parts.append(pack_str(key))
+            parts.append(METRIC_STATE.pack(
+                metric["count"], metric["sum"], metric["min"], metric["max"]
+            ))
+        return b"".join(parts)
+
+    def unpack_state(self, reader: SnapshotReader) -> None:
+        """
+        Restore the state packed by `pack_state`.
+
+        Args:
+            reader (SnapshotReader): Reader positioned on the state.
+        """
+        self.temp, rejected, size = reader.read(SENSOR_STATE)
+        metrics: Dict[str, Dict[str, float]] = {}
+        for _ in range(size):
+            key: str = reader.read_str()
+            total_count, total, low, high = reader.read(METRIC_STATE)
+            metrics[key] = {
+                "count": total_count,
+                "sum": total,
+                "mean": total / total_count if total_count else 0.0,
+                "min": low,
+                "max": high,
+            }
+        self._state.assign("rejected", rejected)
+        self._state.assign("metrics", metrics)
+
+
+OPERATIONS: Dict[str, int] = {"buy": 1, "sell": -1}
+
+
+def parse_cents(amount: str) -> int:
+    """
+    Parse a decimal amount into integer cents without going through float.
+
+    Args:
+        amount (str): The amount (e.g. '100', '12.5', '-0.05').
+
+    Returns:
+        int: The amount in cents.
+
+    Raises:
+        ValueError: If the amount is not a number with at most 2 decimals.
+    """
+    if "." not in amount:
+        return int(amount) * 100
+    sign: int = -1 if amount[:1] == "-" else 1
+    digits: str = amount[1:] if amount[:1] in ("-", "+") else amount
+    whole, _, fraction = digits.partition(".")
+    if (
+        not fraction.isdigit() or len(fraction) > 2
+        or not (whole == "" or whole.isdigit())
+    ):
+        raise ValueError(f"Invalid amount: {amount!r}")
+    return sign * (int(whole or "0") * 100 + int(fraction.ljust(2, "0")))
+
+
+def plain_net_cents(data_batch: List[Any]) -> Optional[int]:
+    """
+    Net flow of a batch made only of 'buy:X' and 'sell:X' transactions.
+
+    The common batch without account prefixes is summed with string
+    methods: once every line is known to start with 'buy:' or 'sell:',
+    the prefixes become '+' and '-' signs and the lines are summed by
+    a single map(int, ...).
+
+    Args:
+        data_batch (List[Any]): Non-empty list of transactions.
+
+    Returns:
+        Optional[int]: The net flow in cents, or None when the batch
+        needs the per-transaction loop.
+    """
+    try:
+        joined: str = "\n".join(data_batch)
+    except TypeError:
+        return None
+    size: int = len(data_batch)
+    text: str = "\n" + joined
+    if (
+        joined.count("\n") != size - 1
+        or text.count("\nbuy:") + text.count("\nsell:") != size
+    ):
+        return None
+    lines: List[str] = (
+        text.replace("\nbuy:", "\n+").replace("\nsell:", "\n-")[1:]
+        .split("\n")
+    )
+    try:
+        return sum(map(int, lines)) * 100
+    except ValueError:
+        pass
+    try:
+        return sum(map(parse_cents, lines))
+    except ValueError:
+        return None
+
+
+def format_cents(cents: int) -> str:
+    """
+    Format integer cents as a signed amount.
+
+    Args:
+        cents (int): The amount in cents.
+
+    Returns:
+        str: The amount, e.g. '+75', '-12.05'.
+    """
+    sign: str = "+" if cents >= 0 else "-"
+    units, rest = divmod(abs(cents), 100)
+    if rest:
+        return f"{sign}{units}.{rest:02d}"
+    return f"{sign}{units}"
+
 
 class TransactionStream(DataStream):
     """
     Stream specialized in handling financial transaction data.
 
     Processes buy and sell operations and computes the net flow
-    from batch data containing transaction values.
+    from batch data containing transaction values. Transactions are
+    parsed into exact integer cents, and an optional account prefix
+    ('ACC1:buy:100') feeds a per-account ledger. Batches without
+    account prefixes or windows are summed by `plain_net_cents`.
     """
-    def __init__(self, stream_id: str):
+    label: str = "Transaction data"
+    unit: str = "operations"
+    net_flow_cents: ShardedTotal = ShardedTotal("net_flow_cents")
+    rejected: ShardedTotal = ShardedTotal("rejected")
+    busy_time: ShardedTotal = ShardedTotal("busy_time")
+
+    def __init__(
+        self, stream_id: str, thread_safe: bool = False, sample_every: int = 1
+    ):
         """
         Initialize the TransactionStream with a stream identifier.
 
         Args:
             stream_id (str): Unique identifier for the transaction stream.
+            thread_safe (bool): Shard the statistics per thread.
+            sample_every (int): Time one batch out of `sample_every`.
         """
-        super().__init__(stream_id)
+        super().__init__(stream_id, thread_safe, sample_every)
         self.stream_type: str = "Financial Data"
-        self.net_flow: int = 0
+
+    def new_state(self) -> Dict[str, Any]:
+        """
+        Build an empty statistics shard.
+
+        Returns:
+            Dict[str, Any]: Base counters, net flow, rejected, busy
+            time and ledger.
+        """
+        state: Dict[str, Any] = super().new_state()
+        state["net_flow_cents"] = 0
+        state["rejected"] = 0
+        state["busy_time"] = 0.0
+        state["ledger"] = {}
+        return state
+
+    def merge_state(
+        self, running: Dict[str, Any], shard: Dict[str, Any]
+    ) -> None:
+        """
+        Add the counters and the ledger of a shard.
+
+        Args:
+            running (Dict[str, Any]): The shard to update.
+            shard (Dict[str, Any]): The shard to add.
+        """
+        super().merge_state(running, shard)
+        ledger: Dict[str, int] = running["ledger"]
+        for account, cents in shard["ledger"].items():
+            ledger[account] = ledger.get(account, 0) + cents
+
+    @property
+    def ledger(self) -> Dict[str, int]:
+        """
+        Net flow in cents per account, merged across shards.
+
+        Returns:
+            Dict[str, int]: The ledger.
+        """
+        shards: List[Dict[str, Any]] = self._state.shards()
+        if len(shards) == 1:
+            return shards[0]["ledger"]
+        merged: Dict[str, int] = {}
+        for shard in shards:
+            for account, cents in list(shard["ledger"].items()):
+                merged[account] = merged.get(account, 0) + cents
+        return merged
+
+    @property
+    def net_flow(self) -> Decimal:
+        """
+        Exact net flow of every processed transaction.
+
+        Returns:
+            Decimal: The net flow in units.
+        """
+        return Decimal(self.net_flow_cents) / 100
 
     def process_batch(self, data_batch: List[Any]) -> str:
         """
@@ -133,29 +1872,223 @@ class TransactionStream(DataStream):
 
         Args:
             data_batch (List[Any]): List of transactions
-            (e.g. 'buy:100', 'sell:150').
+            (e.g. 'buy:100', 'sell:150', b'ACC1:buy:12.50').
 
         Returns:
             str: Formatted transaction analysis result.
         """
-        buys: int = 0
-        for elem in data_batch:
-            if "buy" in elem:
-                buys += int(elem[4:])
-        sells: int = 0
-        for elem in data_batch:
-            if "sell" in elem:
-                sells += int(elem[5:])
-        net: int = buys - sells
-        sign: str = "+" if net >= 0 else ""
-
-        self.total_processed += len(data_batch)
-        self.batches_processed += 1
-        self.net_flow += net
+        started: Optional[float] = self.start_timer()
+        start: float = perf_counter()
+        state: Dict[str, Any] = self._state.local()
+        ledger: Dict[str, int] = state["ledger"]
+        default: str = self.stream_id
+        amounts: Optional[List[float]] = [] if self.windows else None
+        net: Optional[int] = None
+        rejected: int = 0
+
+        if data_batch and amounts is None:
+            net = plain_net_cents(data_batch)
+            if net is not None:
+                ledger[default] = ledger.get(default, 0) + net
+
+        if net is None:
+            net = 0
+            for elem in data_batch:
+                try:
+                    if type(elem) is not str:
+                        elem = str(elem, "ascii")
+                    head, _, amount = elem.rpartition(":")
+                    account, _, operation = head.rpartition(":")
+                    sign: Optional[int] = OPERATIONS.get(operation)
+                    if sign is None:
+                        raise ValueError(f"Invalid operation: {operation!r}")
+                    cents: int = sign * parse_cents(amount)
+                except (TypeError, ValueError):
+                    rejected += 1
+                    continue
+                net += cents
+                account = account or default
+                ledger[account] = ledger.get(account, 0) + cents
+                if amounts is not None:
+                    amounts.append(cents / 100)
+
+        if amounts:
+            self.feed_windows(amounts)
+        state["net_flow_cents"] += net
+        state["rejected"] += rejected
+        state["busy_time"] += perf_counter() - start
+        self.record_batch(len(data_batch), started)
         return (
             f"Transaction analysis: {self.total_processed} "
-            f"operations, net flow: {sign}{net} units"
+            f"operations, net flow: {format_cents(net)} units"
+        )
+
+    def get_stats(self) -> Dict[str, Union[str, int, float]]:
+        """
+        Return stream statistics with ledger and throughput figures.
+
+        Returns:
+            Dict[str, Union[str, int, float]]: Base statistics plus
+            net_flow_cents, accounts, rejected and throughput in
+            operations per second of processing time.
+        """
+        stats: Dict[str, Union[str, int, float]] = super().get_stats()
+        stats["net_flow_cents"] = self.net_flow_cents
+        stats["accounts"] = len(self.ledger)
+        stats["rejected"] = self.rejected
+        stats["throughput"] = (
+            self.total_processed / self.busy_time if self.busy_time else 0.0
+        )
+        return stats
+
+    def pack_state(self) -> bytes:
+        """
+        Pack net flow, rejected count, busy time and the ledger.
+
+        Returns:
+            bytes: The packed state.
+        """
+        parts: List[bytes] = [TRANSACTION_STATE.pack(
+            self.net_flow_cents, self.rejected, self.busy_time,
+            len(self.ledger),
+        )]
+        for account, cents in self.ledger.items():
+            parts.append(pack_str(account))
+            parts.append(LEDGER_ENTRY.pack(cents))
+        return b"".join(parts)
+
+    def unpack_state(self, reader: SnapshotReader) -> None:
+        """
+        Restore the state packed by `pack_state`.
+
+        Args:
+            reader (SnapshotReader): Reader positioned on the state.
+        """
+        net_flow_cents, rejected, busy_time, size = (
+            reader.read(TRANSACTION_STATE)
+        )
+        ledger: Dict[str, int] = {}
+        for _ in range(size):
+            account: str = reader.read_str()
+            ledger[account] = reader.read(LEDGER_ENTRY)[0]
+        self._state.assign("net_flow_cents", net_flow_cents)
+        self._state.assign("rejected", rejected)
+        self._state.assign("busy_time", busy_time)
+        self._state.assign("ledger", ledger)
+
+
+class CountMinSketch:
+    """
+    Approximate per-key counts in a fixed `width` x `depth` table.
+
+    Estimates never undercount and overcount by at most
+    2 * total / width with probability 1 - 2 ** -depth. Keys are hashed
+    with CRC-32 of their text, so the rows stay valid across processes
+    and can be checkpointed.
+    """
+    # Odd multipliers of a multiply-shift hash family, one per row.
+    SEEDS: Tuple[int, ...] = (
+        0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F,
+        0x165667B1, 0xD3A2646D, 0xFD7046C5, 0xB55A4F09,
+    )
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            width (int): Counters per row.
+            depth (int): Number of rows, at most 8.
+        """
+        self.width: int = width
+        self.seeds: Tuple[int, ...] = self.SEEDS[:depth]
+        self.rows: List[array] = [array("Q", bytes(8 * width))
+                                  for _ in self.seeds]
+
+    def add(self, key: Any, amount: int = 1) -> None:
+        """
+        Count `amount` occurrences of a key.
+
+        Args:
+            key (Any): The hashable key.
+            amount (int): Occurrences to add.
+        """
+        digest: int = crc32(str(key).encode("utf-8"))
+        width: int = self.width
+        for seed, row in zip(self.seeds, self.rows):
+            row[((digest * seed) >> 16) % width] += amount
+
+    def estimate(self, key: Any) -> int:
+        """
+        Return the estimated count of a key.
+
+        Args:
+            key (Any): The hashable key.
+
+        Returns:
+            int: The estimated count, never below the true one.
+        """
+        digest: int = crc32(str(key).encode("utf-8"))
+        width: int = self.width
+        return min(
+            row[((digest * seed) >> 16) % width]
+            for seed, row in zip(self.seeds, self.rows)
+        )
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy hitters: the top `capacity` keys in fixed memory.
+
+    When a new key arrives and the table is full, it takes over the slot
+    of the least counted key and inherits its count as error bound.
+    """
+    def __init__(self, capacity: int = 10):
+        """
+        Initialize an empty table.
+
+        Args:
+            capacity (int): Number of keys tracked.
+        """
+        self.capacity: int = capacity
+        self.counts: Dict[Any, int] = {}
+        self.errors: Dict[Any, int] = {}
+
+    def add(self, key: Any, amount: int = 1) -> None:
+        """
+        Count `amount` occurrences of a key.
+
+        Args:
+            key (Any): The hashable key.
+            amount (int): Occurrences to add.
+        """
+        counts: Dict[Any, int] = self.counts
+        if key in counts:
+            counts[key] += amount
+        elif len(counts) < self.capacity:
+            counts[key] = amount
+            self.errors[key] = 0
+        else:
+            evicted: Any = min(counts, key=counts.__getitem__)
+            floor: int = counts.pop(evicted)
+            del self.errors[evicted]
+            counts[key] = floor + amount
+            self.errors[key] = floor
+
+    def top(self, count: Optional[int] = None) -> List[Tuple[Any, int]]:
+        """
+        Return the most frequent keys.
+
+        Args:
+            count (Optional[int]): Number of keys, all tracked if omitted.
+
+        Returns:
+            List[Tuple[Any, int]]: (key, count) pairs, most frequent first.
+        """
+        ranked: List[Tuple[Any, int]] = sorted(
+            self.counts.items(), key=lambda item: item[1], reverse=True
         )
+        return ranked if count is None else ranked[:count]
 
 
 class EventStream(DataStream):
@@ -163,17 +2096,53 @@ class EventStream(DataStream):
     Stream specialized in handling system event data.
 
     Processes system events and counts errors from batch data
-    containing event types like login, logout, and error.
+    containing event types like login, logout, and error. Event types
+    (text before ':') are counted in a Count-Min sketch and a
+    Space-Saving top-K table, so memory stays fixed whatever the number
+    of distinct types.
     """
-    def __init__(self, stream_id: str):
+    label: str = "Event data"
+    unit: str = "events"
+    errors: ShardedTotal = ShardedTotal("errors")
+
+    def __init__(
+        self,
+        stream_id: str,
+        top_k: int = 10,
+        sketch_width: int = 2048,
+        sketch_depth: int = 4,
+        thread_safe: bool = False,
+        sample_every: int = 1,
+    ):
         """
         Initialize the EventStream with a stream identifier.
 
         Args:
             stream_id (str): Unique identifier for the event stream.
+            top_k (int): Number of heavy hitters tracked.
+            sketch_width (int): Counters per Count-Min row.
+            sketch_depth (int): Number of Count-Min rows.
+            thread_safe (bool): Shard the statistics per thread.
+            sample_every (int): Time one batch out of `sample_every`.
         """
-        super().__init__(stream_id)
+        super().__init__(stream_id, thread_safe, sample_every)
         self.stream_type: str = "System Events"
+        self._sketch_lock: Lock = Lock()
+        self.sketch: CountMinSketch = CountMinSketch(
+            sketch_width, sketch_depth
+        )
+        self.heavy_hitters: SpaceSaving = SpaceSaving(top_k)
+
+    def new_state(self) -> Dict[str, Any]:
+        """
+        Build an empty statistics shard.
+
+        Returns:
+            Dict[str, Any]: Base counters and errors.
+        """
+        state: Dict[str, Any] = super().new_state()
+        state["errors"] = 0
+        return state
 
     def process_batch(self, data_batch: List[Any]) -> str:
         """
@@ -186,19 +2155,111 @@ class EventStream(DataStream):
         Returns:
             str: Formatted event analysis result.
         """
+        started: Optional[float] = self.start_timer()
         errors: int = 0
-        for elem in data_batch:
-            if "error" in elem:
-                errors += 1
+        types: Counter = Counter()
+        for event, amount in Counter(data_batch).items():
+            if "error" in event:
+                errors += amount
+            types[event.partition(":")[0]] += amount
+        with self._sketch_lock:
+            for event_type, amount in types.items():
+                self.sketch.add(event_type, amount)
+                self.heavy_hitters.add(event_type, amount)
+        self.feed_windows(
+            1.0 if "error" in elem else 0.0 for elem in data_batch
+        )
 
-        self.total_processed += len(data_batch)
-        self.batches_processed += 1
+        self._state.local()["errors"] += errors
+        self.record_batch(len(data_batch), started)
 
         return (
             f"Event analysis: {self.total_processed} "
             f"events, {errors} error detected"
         )
 
+    def estimate(self, event_type: str) -> int:
+        """
+        Return the estimated number of events of a type.
+
+        Args:
+            event_type (str): The event type.
+
+        Returns:
+            int: The Count-Min estimate.
+        """
+        return self.sketch.estimate(event_type)
+
+    def top_events(self, count: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Return the most frequent event types.
+
+        Args:
+            count (Optional[int]): Number of types, top_k if omitted.
+
+        Returns:
+            List[Tuple[str, int]]: (type, count) pairs, most frequent first.
+        """
+        return self.heavy_hitters.top(count)
+
+    def get_stats(self) -> Dict[str, Union[str, int, float]]:
+        """
+        Return stream statistics with error figures.
+
+        Returns:
+            Dict[str, Union[str, int, float]]: Base statistics plus the
+            total errors and the overall error rate.
+        """
+        stats: Dict[str, Union[str, int, float]] = super().get_stats()
+        stats["errors"] = self.errors
+        stats["error_rate"] = (
+            self.errors / self.total_processed if self.total_processed
+            else 0.0
+        )
+        return stats
+
+    def pack_state(self) -> bytes:
+        """
+        Pack the error count, the heavy hitters table and the sketch.
+
+        Returns:
+            bytes: The packed state.
+        """
+        heavy: SpaceSaving = self.heavy_hitters
+        sketch: CountMinSketch = self.sketch
+        parts: List[bytes] = [EVENT_STATE.pack(self.errors, len(heavy.counts))]
+        for key, amount in heavy.counts.items():
+            parts.append(pack_str(key))
+            parts.append(HEAVY_ENTRY.pack(amount, heavy.errors[key]))
+        parts.append(SKETCH_SHAPE.pack(sketch.width, len(sketch.rows)))
+        for row in sketch.rows:
+            if byteorder == "big":
+                row = array("Q", row)
+                row.byteswap()
+            parts.append(row.tobytes())
+        return b"".join(parts)
+
+    def unpack_state(self, reader: SnapshotReader) -> None:
+        """
+        Restore the state packed by `pack_state`.
+
+        Args:
+            reader (SnapshotReader): Reader positioned on the state.
+        """
+        errors, size = reader.read(EVENT_STATE)
+        self._state.assign("errors", errors)
+        heavy: SpaceSaving = self.heavy_hitters
+        heavy.counts = {}
+        heavy.errors = {}
+        for _ in range(size):
+            key: str = reader.read_str()
+            heavy.counts[key], heavy.errors[key] = reader.read(HEAVY_ENTRY)
+        width, depth = reader.read(SKETCH_SHAPE)
+        sketch: CountMinSketch = CountMinSketch(width, depth)
+        sketch.rows = [reader.read_array("Q", width) for _ in range(depth)]
+        with self._sketch_lock:
+            self.sketch = sketch
+
 
 class StreamProcessor():
     """
@@ -212,6 +2273,8 @@ class StreamProcessor():
         Initialize the StreamProcessor with an empty stream list.
         """
         self.streams: List[DataStream] = []
+        self.rounds: int = 0
+        self.round_latency: LogHistogram = LogHistogram()
 
     def add_stream(self, stream: DataStream):
         """
@@ -222,33 +2285,97 @@ class StreamProcessor():
         """
         self.streams.append(stream)
 
-    def process_all(self, data_batch: List[Any]):
+    def process_all(
+        self, data_batch: List[Any], workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Process all streams with their respective data batches.
 
+        With `workers`, independent streams run in parallel on a thread
+        pool. Batches aimed at the same stream object always run in
+        order on one worker, so a stream never sees concurrent calls.
+
         Args:
             data_batch (List[Any]): List of batches, one per stream.
+            workers (Optional[int]): Thread pool size, sequential if
+            omitted.
+
+        Returns:
+            List[Dict[str, Any]]: One report per registered stream with
+            stream_id, stream_type, result, summary and stats.
+        """
+        started: float = perf_counter()
+        groups: Dict[int, List[int]] = {}
+        for pos, stream in enumerate(self.streams[:len(data_batch)]):
+            groups.setdefault(id(stream), []).append(pos)
+
+        def run(positions: List[int]) -> List[Tuple[int, Dict[str, Any]]]:
+            done: List[Tuple[int, Dict[str, Any]]] = []
+            for pos in positions:
+                stream: DataStream = self.streams[pos]
+                result: str = stream.process_batch(data_batch[pos])
+                done.append((pos, {
+                    "stream_id": stream.stream_id,
+                    "stream_type": getattr(stream, "stream_type", ""),
+                    "result": result,
+                    "summary": stream.summary(),
+                    "stats": stream.get_stats(),
+                }))
+            return done
+
+        reports: List[Dict[str, Any]] = [{}] * sum(map(len, groups.values()))
+        pool: Optional[ThreadPoolExecutor] = None
+        if workers is not None and workers > 1 and len(groups) > 1:
+            pool = ThreadPoolExecutor(min(workers, len(groups)))
+        outcomes: Iterable[List[Tuple[int, Dict[str, Any]]]] = (
+            map(run, groups.values()) if pool is None
+            else pool.map(run, groups.values())
+        )
+        try:
+            for done in outcomes:
+                for pos, report in done:
+                    reports[pos] = report
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        self.round_latency.record(int((perf_counter() - started) * 1_000_000))
+        self.rounds += 1
+        print(f"Batch {self.rounds} Results:")
+        for report in reports:
+            print(f"- {report['summary']}")
+        return reports
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return processor statistics with every stream's statistics.
+
+        Returns:
+            Dict[str, Any]: rounds, round latency percentiles in
+            microseconds and the list of stream statistics.
+        """
+        return {
+            "rounds": self.rounds,
+            "round_latency_us_p50": self.round_latency.percentile(50),
+            "round_latency_us_p99": self.round_latency.percentile(99),
+            "round_latency_us_max": self.round_latency.maximum,
+            "streams": [stream.get_stats() for stream in self.streams],
+        }
+
+    def start_reporter(
+        self, interval: float = 10.0, sink: Callable[[Any], None] = print
+    ) -> MetricsReporter:
+        """
+        Periodically hand the processor statistics to a sink.
+
+        Args:
+            interval (float): Seconds between two reports.
+            sink (Callable[[Any], None]): Receives each report.
+
+        Returns:
+            MetricsReporter: The running reporter, `stop` it when done.
         """
-        i: int = 0
-        print("Batch 1 Results:")
-        for stream in self.streams:
-            stream.process_batch(data_batch[i])
-
-            if isinstance(stream, SensorStream):
-                print(
-                    f"- Sensor data: {stream.total_processed} "
-                    "readings processed"
-                    )
-            elif isinstance(stream, TransactionStream):
-                print(
-                    f"- Transaction data: {stream.total_processed} "
-                    "operations processed"
-                    )
-            elif isinstance(stream, EventStream):
-                print(
-                    f"- Event data: {stream.total_processed} events processed"
-                    )
-            i += 1
+        return MetricsReporter(self.get_stats, interval, sink).start()
 
 
 def main() -> None:
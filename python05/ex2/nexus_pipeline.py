@@ -1,9 +1,83 @@
+import csv
+import json
+import multiprocessing
+import os
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Union, Protocol
+from collections import deque
+from contextlib import nullcontext
+from itertools import chain, islice
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from time import perf_counter
+from typing import (
+    IO, Any, Callable, Deque, Iterable, Iterator, List, Dict, Optional,
+    Sequence, Tuple, Union, Protocol
+)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE: bool = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+READ_BUFFER_SIZE: int = 1 << 20
+CSV_SAMPLE_ROWS: int = 100
+BOOL_VALUES: Dict[str, bool] = {"true": True, "false": False}
+JSONL_FIELDS: Tuple[str, ...] = ("sensor", "value", "unit")
+QUARANTINE_SIZE: int = 100
+STOP_POLL_SECONDS: float = 0.1
+
+
+class Record:
+    """
+    Slotted record carried through every stage of a pipeline.
+
+    Stages update the same record in place instead of wrapping the
+    payload in a new envelope dict at each step.
+    """
+    __slots__ = ("raw", "status", "transformed", "metadata")
+
+    def __init__(self, raw: Any):
+        """
+        Initialize a record around a raw payload.
+
+        Args:
+            raw (Any): The input payload.
+        """
+        self.raw: Any = raw
+        self.status: str = "new"
+        self.transformed: bool = False
+        self.metadata: Optional[str] = None
+
+    def __repr__(self) -> str:
+        """
+        Return a readable representation of the record.
+
+        Returns:
+            str: The record fields.
+        """
+        return (
+            f"Record(raw={self.raw!r}, status={self.status!r}, "
+            f"transformed={self.transformed}, metadata={self.metadata!r})"
+        )
 
 
 class ProcessingStage(Protocol):
-    """Protocol defining the interface for all processing stages."""
+    """
+    Protocol defining the interface for all processing stages.
+
+    Stages may also define `process_batch(records)`, which takes and
+    returns a list of Record. Stages without it get each record's
+    payload through `process` instead.
+
+    The pipeline compiler reads three optional class attributes:
+    `stateless` (the stage keeps no state between records, so it may
+    be fused with its neighbours), `identity` (the stage leaves
+    records untouched and may be dropped) and `annotates` (the stage
+    only sets record fields and leaves the payload as it is, so
+    single-payload calls may skip it). All default to False.
+    """
 
     def process(self, data: Any) -> Any:
         """
@@ -18,12 +92,279 @@ class ProcessingStage(Protocol):
         ...
 
 
+def stage_update(stage: ProcessingStage) -> Callable[[Record], None]:
+    """
+    Return a function applying one stage to a single record.
+
+    Uses the stage's `update(record)` method when it has one, otherwise
+    wraps `process` around the record payload.
+
+    Args:
+        stage (ProcessingStage): The stage to wrap.
+
+    Returns:
+        Callable[[Record], None]: Updates a record in place.
+    """
+    update: Optional[Callable[[Record], None]] = getattr(
+        stage, "update", None
+    )
+    if update is not None:
+        return update
+    process: Callable[[Any], Any] = stage.process
+
+    def apply(record: Record) -> None:
+        record.raw = process(record.raw)
+
+    return apply
+
+
+class FusedStage:
+    """Several adjacent stateless stages run as a single stage."""
+
+    stateless: bool = True
+    identity: bool = False
+
+    def __init__(self, stages: Sequence[ProcessingStage]):
+        """
+        Initialize the fused stage.
+
+        Args:
+            stages (Sequence[ProcessingStage]): The stages to fuse, in
+                pipeline order.
+        """
+        self.stages: List[ProcessingStage] = list(stages)
+        self.name: str = "+".join(type(stage).__name__ for stage in stages)
+        self.updates: List[Callable[[Record], None]] = [
+            stage_update(stage) for stage in stages
+        ]
+
+    def process(self, data: Any) -> Any:
+        """
+        Run one payload through every fused stage.
+
+        Args:
+            data (Any): The input payload.
+
+        Returns:
+            Any: The payload returned by the last stage.
+        """
+        for stage in self.stages:
+            data = stage.process(data)
+        return data
+
+    def process_batch(self, records: List[Record]) -> List[Record]:
+        """
+        Run a batch through every fused stage in a single pass.
+
+        Args:
+            records (List[Record]): The records to update.
+
+        Returns:
+            List[Record]: The same records.
+        """
+        updates: List[Callable[[Record], None]] = self.updates
+        for record in records:
+            for update in updates:
+                update(record)
+        return records
+
+
+def compile_stages(
+    stages: Sequence[ProcessingStage],
+) -> List[ProcessingStage]:
+    """
+    Build an execution plan from a list of stages.
+
+    Identity stages are dropped and runs of two or more adjacent
+    stateless stages become one FusedStage. Other stages are kept as
+    they are.
+
+    Args:
+        stages (Sequence[ProcessingStage]): The stages in pipeline order.
+
+    Returns:
+        List[ProcessingStage]: The stages to run.
+    """
+    plan: List[ProcessingStage] = []
+    run: List[ProcessingStage] = []
+    for stage in stages:
+        if getattr(stage, "identity", False):
+            continue
+        if getattr(stage, "stateless", False):
+            run.append(stage)
+            continue
+        if run:
+            plan.append(FusedStage(run) if len(run) > 1 else run[0])
+            run = []
+        plan.append(stage)
+    if run:
+        plan.append(FusedStage(run) if len(run) > 1 else run[0])
+    return plan
+
+
+def payload_steps(
+    plan: Sequence[ProcessingStage],
+) -> Optional[Tuple[Callable[[Any], Any], ...]]:
+    """
+    Reduce an execution plan to the functions applied to a payload.
+
+    Annotating stages are skipped and the members of fused stages are
+    taken one by one. A stage working on whole records through
+    `update` or `process_batch` needs a Record, so no steps are
+    returned for the plan.
+
+    Args:
+        plan (Sequence[ProcessingStage]): The compiled stages.
+
+    Returns:
+        Optional[Tuple[Callable[[Any], Any], ...]]: The `process`
+        functions to apply in order, None if a stage needs a Record.
+    """
+    steps: List[Callable[[Any], Any]] = []
+    for step in plan:
+        members: Sequence[ProcessingStage] = (
+            step.stages if isinstance(step, FusedStage) else [step]
+        )
+        for stage in members:
+            if getattr(stage, "annotates", False):
+                continue
+            if hasattr(stage, "update") or hasattr(stage, "process_batch"):
+                return None
+            steps.append(stage.process)
+    return tuple(steps)
+
+
+def run_stages(
+    stages: Sequence[ProcessingStage],
+    records: List[Record],
+    timings: Dict[str, float],
+    offset: int = 0,
+) -> List[Record]:
+    """
+    Run a batch of records through a sequence of stages.
+
+    Each stage gets the whole batch through `process_batch` when it
+    has one, otherwise `process` is called on every payload.
+
+    Args:
+        stages (Sequence[ProcessingStage]): The stages to run in order.
+        records (List[Record]): The batch to process.
+        timings (Dict[str, float]): Seconds spent per stage, updated
+            in place.
+        offset (int): Pipeline index of the first stage, used in the
+            timing keys.
+
+    Returns:
+        List[Record]: The processed records.
+    """
+    for index, stage in enumerate(stages, offset):
+        name: str = f"{index}:{getattr(stage, 'name', type(stage).__name__)}"
+        start: float = perf_counter()
+        process_batch: Optional[Callable[[List[Record]], List[Record]]]
+        process_batch = getattr(stage, "process_batch", None)
+        if process_batch is not None:
+            records = process_batch(records)
+        else:
+            process: Callable[[Any], Any] = stage.process
+            for record in records:
+                record.raw = process(record.raw)
+        timings[name] = timings.get(name, 0.0) + perf_counter() - start
+    return records
+
+
+def put_unless_stopped(queue: Any, item: Any, stop: Any) -> bool:
+    """
+    Put an item on a bounded queue, giving up once `stop` is set.
+
+    Args:
+        queue (Any): The queue to write to.
+        item (Any): The item to put.
+        stop (Any): Event set when the consumer stopped reading.
+
+    Returns:
+        bool: True if the item was queued.
+    """
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=STOP_POLL_SECONDS)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def get_unless_stopped(queue: Any, stop: Any) -> Optional[Any]:
+    """
+    Get an item from a queue, giving up once `stop` is set.
+
+    Args:
+        queue (Any): The queue to read from.
+        stop (Any): Event set when the consumer stopped reading.
+
+    Returns:
+        Optional[Any]: The item, None if the run was stopped.
+    """
+    while not stop.is_set():
+        try:
+            return queue.get(timeout=STOP_POLL_SECONDS)
+        except Empty:
+            continue
+    return None
+
+
+def stage_worker(
+    stages: Sequence[ProcessingStage],
+    offset: int,
+    inbox: Any,
+    outbox: Any,
+    stop: Any,
+) -> None:
+    """
+    Worker loop running one group of stages between two queues.
+
+    Messages are ("batch", records), ("error", exception) and
+    ("done", timings). The first error, raised here or received from
+    upstream, is forwarded and ends the worker. Blocking queue calls
+    give up once `stop` is set, so the worker exits when the consumer
+    stops reading.
+
+    Args:
+        stages (Sequence[ProcessingStage]): The stages of this group.
+        offset (int): Pipeline index of the first stage of the group.
+        inbox (Any): Queue the batches are read from.
+        outbox (Any): Queue the processed batches are written to.
+        stop (Any): Event shared by the run, a threading or a
+            multiprocessing Event.
+    """
+    timings: Dict[str, float] = {}
+    while True:
+        message: Optional[Tuple[str, Any]] = get_unless_stopped(inbox, stop)
+        if message is None:
+            return
+        kind, payload = message
+        if kind == "done":
+            payload.update(timings)
+            put_unless_stopped(outbox, ("done", payload), stop)
+            return
+        if kind == "error":
+            put_unless_stopped(outbox, message, stop)
+            return
+        try:
+            message = ("batch", run_stages(stages, payload, timings, offset))
+        except Exception as error:
+            put_unless_stopped(outbox, ("error", error), stop)
+            return
+        if not put_unless_stopped(outbox, message, stop):
+            return
+
+
 class ProcessingPipeline(ABC):
     """
     Abstract base class defining the interface for all data pipelines.
 
     Each pipeline manages a list of stages and orchestrates data flow
-    through them sequentially.
+    through them sequentially. Batches run through a compiled plan of
+    the stages, cached until `add_stage` changes the list.
     """
 
     def __init__(self, pipeline_id: str):
@@ -36,6 +377,9 @@ class ProcessingPipeline(ABC):
         self.pipeline_id: str = pipeline_id
         self.stages: List[ProcessingStage] = []
         self.process_count: int = 0
+        self.stage_timings: Dict[str, float] = {}
+        self._plan: Optional[List[ProcessingStage]] = None
+        self._steps: Optional[Tuple[Callable[[Any], Any], ...]] = None
 
     def add_stage(self, stage: ProcessingStage) -> None:
         """
@@ -45,6 +389,22 @@ class ProcessingPipeline(ABC):
             stage (ProcessingStage): The stage to add.
         """
         self.stages.append(stage)
+        self._plan = None
+
+    def compile(self) -> List[ProcessingStage]:
+        """
+        Return the execution plan of the pipeline.
+
+        The plan comes from compile_stages and is cached until the
+        next call to `add_stage`, along with its payload_steps.
+
+        Returns:
+            List[ProcessingStage]: The stages to run.
+        """
+        if self._plan is None:
+            self._plan = compile_stages(self.stages)
+            self._steps = payload_steps(self._plan)
+        return self._plan
 
     @abstractmethod
     def process(self, data: Any) -> Union[str, Any]:
@@ -69,10 +429,217 @@ class ProcessingPipeline(ABC):
         """
         return {"id": self.pipeline_id, "count": self.process_count}
 
+    def run_batch(self, data: Iterable[Any]) -> List[Record]:
+        """
+        Push a batch of payloads through every stage.
+
+        Runs the compiled plan. Each step gets the whole batch through
+        `process_batch` when it has one, otherwise `process` is called
+        on every payload. Time spent in each step is added to
+        `stage_timings`.
+
+        Args:
+            data (Iterable[Any]): The payloads to process.
+
+        Returns:
+            List[Record]: One record per payload, in input order.
+        """
+        records: List[Record] = run_stages(
+            self.compile(), [Record(raw) for raw in data], self.stage_timings
+        )
+        self.process_count += len(records)
+        return records
+
+    def run_payload(self, data: Any) -> Any:
+        """
+        Push a single payload through every stage.
+
+        When the plan reduces to payload_steps, the payload goes
+        through them directly: no Record is built and the call is not
+        added to `stage_timings`. Otherwise it runs as a batch of one.
+
+        Args:
+            data (Any): The payload to process.
+
+        Returns:
+            Any: The processed payload.
+        """
+        if self._plan is None:
+            self.compile()
+        steps: Optional[Tuple[Callable[[Any], Any], ...]] = self._steps
+        if steps is None:
+            return self.run_batch((data,))[0].raw
+        for step in steps:
+            data = step(data)
+        self.process_count += 1
+        return data
+
+    def run_pipelined(
+        self,
+        data: Iterable[Any],
+        batch_size: int = 1024,
+        queue_size: int = 4,
+        groups: Optional[Sequence[int]] = None,
+        use_processes: bool = False,
+    ) -> Iterator[Record]:
+        """
+        Stream payloads through the stages with one worker per group.
+
+        Stage groups run concurrently and pass batches through bounded
+        queues: a slow group blocks the ones before it once its queue
+        is full. Queues are FIFO and each group has a single worker, so
+        records come out in input order. Processes sidestep the GIL for
+        CPU-heavy stages but need picklable stages and payloads.
+
+        The first error is raised as soon as it reaches the consumer.
+        On an error, or when the generator is closed early, a shared
+        stop event makes the feeder and the workers leave their queue
+        calls, and they are joined before returning. The feeder is
+        only waited for briefly, since it may be blocked inside `data`.
+
+        Args:
+            data (Iterable[Any]): The payloads to process.
+            batch_size (int): Records per batch sent between workers.
+            queue_size (int): Batches each queue can hold.
+            groups (Optional[Sequence[int]]): Number of consecutive
+                stages per worker, one stage per worker by default.
+            use_processes (bool): Run the groups in processes instead
+                of threads.
+
+        Yields:
+            Record: The processed records, in input order.
+
+        Raises:
+            ValueError: If the group sizes do not cover every stage.
+            Exception: The first error raised by a stage or by `data`,
+                once the records processed before it are yielded.
+        """
+        sizes: List[int] = list(groups or [1] * len(self.stages))
+        if sum(sizes) != len(self.stages) or min(sizes, default=1) < 1:
+            raise ValueError("Stage groups must cover every stage")
+
+        make_queue: Callable[[int], Any] = Queue
+        spawn: Callable[..., Any] = Thread
+        stop: Any = Event()
+        if use_processes:
+            make_queue = multiprocessing.Queue
+            spawn = multiprocessing.Process
+            stop = multiprocessing.Event()
+        queues: List[Any] = [
+            make_queue(queue_size) for _ in range(len(sizes) + 1)
+        ]
+        workers: List[Any] = []
+        offset: int = 0
+        for index, size in enumerate(sizes):
+            stages: List[ProcessingStage] = self.stages[offset:offset + size]
+            workers.append(spawn(
+                target=stage_worker,
+                args=(stages, offset, queues[index], queues[index + 1], stop),
+                daemon=True,
+            ))
+            offset += size
+
+        def feed() -> None:
+            items: Iterator[Any] = iter(data)
+            try:
+                while not stop.is_set():
+                    batch: List[Record] = [
+                        Record(raw) for raw in islice(items, batch_size)
+                    ]
+                    if not batch:
+                        break
+                    if not put_unless_stopped(queues[0], ("batch", batch),
+                                              stop):
+                        return
+            except Exception as error:
+                put_unless_stopped(queues[0], ("error", error), stop)
+                return
+            put_unless_stopped(queues[0], ("done", {}), stop)
+
+        feeder: Thread = Thread(target=feed, daemon=True)
+        for worker in workers:
+            worker.start()
+        feeder.start()
+
+        try:
+            while True:
+                message: Tuple[str, Any] = queues[-1].get()
+                kind, payload = message
+                if kind == "done":
+                    for name, seconds in payload.items():
+                        self.stage_timings[name] = (
+                            self.stage_timings.get(name, 0.0) + seconds
+                        )
+                    break
+                if kind == "error":
+                    raise payload
+                self.process_count += len(payload)
+                yield from payload
+        finally:
+            stop.set()
+            if use_processes:
+                for worker in workers:
+                    worker.terminate()
+                for queue in queues:
+                    queue.cancel_join_thread()
+                    queue.close()
+            for worker in workers:
+                worker.join()
+            feeder.join(STOP_POLL_SECONDS * 10)
+
+    def process_many(self, data: Iterable[Any]) -> List[Any]:
+        """
+        Process a batch of payloads and format every result.
+
+        When the plan reduces to payload_steps, each step and the
+        rendering are mapped over the whole batch, and each step's time
+        goes to `stage_timings` under "step:<function>". Otherwise the
+        batch goes through `run_batch`.
+
+        Args:
+            data (Iterable[Any]): The payloads to process.
+
+        Returns:
+            List[Any]: One formatted result per payload.
+        """
+        if self._plan is None:
+            self.compile()
+        steps: Optional[Tuple[Callable[[Any], Any], ...]] = self._steps
+        render: Callable[[Any], Any] = self.render
+        if steps is None:
+            return [render(record.raw) for record in self.run_batch(data)]
+        payloads: Iterable[Any] = data
+        timings: Dict[str, float] = self.stage_timings
+        for step in steps:
+            name: str = f"step:{getattr(step, '__qualname__', step)}"
+            start: float = perf_counter()
+            payloads = list(map(step, payloads))
+            timings[name] = timings.get(name, 0.0) + perf_counter() - start
+        results: List[Any] = list(map(render, payloads))
+        self.process_count += len(results)
+        return results
+
+    def render(self, raw: Any) -> Union[str, Any]:
+        """
+        Format the payload of a processed record.
+
+        Args:
+            raw (Any): The processed payload.
+
+        Returns:
+            Union[str, Any]: The formatted result, the payload itself
+            by default.
+        """
+        return raw
+
 
 class InputStage:
     """Stage responsible for receiving and structuring raw input data."""
 
+    stateless: bool = True
+    identity: bool = False
+    annotates: bool = True
+
     def process(self, data: Any) -> Dict:
         """
         Receive raw data and structure it into a dictionary.
@@ -85,10 +652,37 @@ class InputStage:
         """
         return {"raw": data, "status": "received"}
 
+    def process_batch(self, records: List[Record]) -> List[Record]:
+        """
+        Mark a batch of records as received.
+
+        Args:
+            records (List[Record]): The records to update.
+
+        Returns:
+            List[Record]: The same records.
+        """
+        for record in records:
+            record.status = "received"
+        return records
+
+    def update(self, record: Record) -> None:
+        """
+        Mark one record as received.
+
+        Args:
+            record (Record): The record to update.
+        """
+        record.status = "received"
+
 
 class TransformStage:
     """Stage responsible for transforming and enriching structured data."""
 
+    stateless: bool = True
+    identity: bool = False
+    annotates: bool = True
+
     def process(self, data: Any) -> Dict:
         """
         Transform and enrich the input data with metadata.
@@ -101,10 +695,39 @@ class TransformStage:
         """
         return {"data": data, "transformed": True, "metadata": "enriched"}
 
+    def process_batch(self, records: List[Record]) -> List[Record]:
+        """
+        Mark a batch of records as transformed and enriched.
+
+        Args:
+            records (List[Record]): The records to update.
+
+        Returns:
+            List[Record]: The same records.
+        """
+        for record in records:
+            record.transformed = True
+            record.metadata = "enriched"
+        return records
+
+    def update(self, record: Record) -> None:
+        """
+        Mark one record as transformed and enriched.
+
+        Args:
+            record (Record): The record to update.
+        """
+        record.transformed = True
+        record.metadata = "enriched"
+
 
 class OutputStage:
     """Stage responsible for delivering the final processed data."""
 
+    stateless: bool = True
+    identity: bool = True
+    annotates: bool = True
+
     def process(self, data: Any) -> Any:
         """
         Return the final processed data.
@@ -117,6 +740,36 @@ class OutputStage:
         """
         return data
 
+    def process_batch(self, records: List[Record]) -> List[Record]:
+        """
+        Deliver a batch of records unchanged.
+
+        Args:
+            records (List[Record]): The records to deliver.
+
+        Returns:
+            List[Record]: The same records.
+        """
+        return records
+
+
+def decode_json(line: bytes) -> Any:
+    """
+    Decode one JSON document, with orjson when it is installed.
+
+    Args:
+        line (bytes): The encoded document.
+
+    Returns:
+        Any: The decoded value.
+
+    Raises:
+        ValueError: If the document is not valid JSON.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(line)
+    return json.loads(line)
+
 
 class JSONAdapter(ProcessingPipeline):
     """
@@ -134,10 +787,75 @@ class JSONAdapter(ProcessingPipeline):
             pipeline_id (str): Unique identifier for the pipeline.
         """
         super().__init__(pipeline_id)
+        self.malformed: int = 0
+        self.quarantine: Deque[Tuple[int, bytes]] = deque(
+            maxlen=QUARANTINE_SIZE
+        )
         self.add_stage(InputStage())
         self.add_stage(TransformStage())
         self.add_stage(OutputStage())
 
+    def stream_jsonl(
+        self,
+        source: Union[str, "os.PathLike[str]", IO[bytes]],
+        fields: Sequence[str] = JSONL_FIELDS,
+        batch_size: int = 4096,
+    ) -> Iterator[Record]:
+        """
+        Ingest newline-delimited JSON as columnar batches.
+
+        Lines are read `batch_size` at a time and decoded with orjson
+        when available. Only `fields` are kept, as one list per field,
+        with None for a missing key. Each batch becomes a single
+        record whose payload is that column dict, so the stages see
+        one record per batch instead of one per line. Lines that fail
+        to decode or do not hold an object are counted in `malformed`.
+        The last QUARANTINE_SIZE of them are kept in `quarantine` as
+        (line number, line) and the run goes on.
+
+        Args:
+            source (Union[str, os.PathLike[str], IO[bytes]]): A file
+                path or a binary file object.
+            fields (Sequence[str]): The keys to extract.
+            batch_size (int): Lines decoded per batch.
+
+        Yields:
+            Record: One record per non-empty batch, holding a dict
+            that maps each field to its list of values.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            context: Any = open(source, "rb", buffering=READ_BUFFER_SIZE)
+        else:
+            context = nullcontext(source)
+
+        with context as file:
+            number: int = 0
+            while True:
+                lines: List[bytes] = list(islice(file, batch_size))
+                if not lines:
+                    return
+                columns: Dict[str, List[Any]] = {name: [] for name in fields}
+                appends: List[Tuple[str, Callable[[Any], None]]] = [
+                    (name, column.append) for name, column in columns.items()
+                ]
+                for number, line in enumerate(lines, number + 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        item: Any = decode_json(line)
+                    except ValueError:
+                        item = None
+                    if not isinstance(item, dict):
+                        self.malformed += 1
+                        self.quarantine.append((number, line))
+                        continue
+                    get: Callable[[str], Any] = item.get
+                    for name, append in appends:
+                        append(get(name))
+                if columns and not any(columns.values()):
+                    continue
+                yield from self.run_batch([columns])
+
     def process(self, data: Any) -> Union[str, Any]:
         """
         Process JSON data through all stages and format the result.
@@ -148,15 +866,85 @@ class JSONAdapter(ProcessingPipeline):
         Returns:
             Union[str, Any]: Formatted temperature reading string.
         """
-        result: Any = data
-        for stage in self.stages:
-            result = stage.process(result)
+        return self.render(self.run_payload(data))
+
+    def render(self, raw: Any) -> Union[str, Any]:
+        """
+        Format a processed JSON reading.
 
-        raw = result["data"]["raw"]
+        Args:
+            raw (Any): JSON data as a dictionary.
+
+        Returns:
+            Union[str, Any]: Formatted temperature reading string.
+        """
         valeur = raw["value"]
         return f"Processed temperature reading: {valeur}°C (Normal range)"
 
 
+def parse_bool(value: str) -> bool:
+    """
+    Convert a CSV cell holding true or false.
+
+    Args:
+        value (str): The cell, in any case.
+
+    Returns:
+        bool: The parsed value.
+
+    Raises:
+        ValueError: If the cell is not a boolean.
+    """
+    try:
+        return BOOL_VALUES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value!r}") from None
+
+
+def infer_type(values: Iterable[str]) -> Callable[[str], Any]:
+    """
+    Pick the narrowest type matching every non-empty sample value.
+
+    Candidates are tried in order: int, float, bool, then str.
+
+    Args:
+        values (Iterable[str]): Sample cells of one column.
+
+    Returns:
+        Callable[[str], Any]: The converter for the column.
+    """
+    cells: List[str] = [value for value in values if value]
+    if not cells:
+        return str
+    for cast in (int, float, parse_bool):
+        try:
+            for cell in cells:
+                cast(cell)
+        except ValueError:
+            continue
+        return cast
+    return str
+
+
+def typed_value(cast: Callable[[str], Any], value: str) -> Any:
+    """
+    Convert one CSV cell, keeping it as text if it does not fit.
+
+    Args:
+        cast (Callable[[str], Any]): The column converter.
+        value (str): The raw cell.
+
+    Returns:
+        Any: The converted value, None for an empty cell.
+    """
+    if not value:
+        return None
+    try:
+        return cast(value)
+    except ValueError:
+        return value
+
+
 class CSVAdapter(ProcessingPipeline):
     """
     Pipeline specialized in handling CSV format data.
@@ -173,10 +961,74 @@ class CSVAdapter(ProcessingPipeline):
             pipeline_id (str): Unique identifier for the pipeline.
         """
         super().__init__(pipeline_id)
+        self.schema: Dict[str, Callable[[str], Any]] = {}
         self.add_stage(InputStage())
         self.add_stage(TransformStage())
         self.add_stage(OutputStage())
 
+    def stream_file(
+        self,
+        source: Union[str, "os.PathLike[str]", IO[str]],
+        batch_size: int = 1024,
+        sample_rows: int = CSV_SAMPLE_ROWS,
+        delimiter: str = ",",
+    ) -> Iterator[Record]:
+        """
+        Stream the rows of a CSV file through the pipeline stages.
+
+        The file is read through a large buffer and parsed by the csv
+        module, so quoted fields and multi-line records are handled.
+        The first line is the header. Column types are inferred from
+        the first `sample_rows` rows and stored in `schema`. Rows then
+        go through the stages `batch_size` at a time as dicts of typed
+        values. Only one batch is held in memory at once.
+
+        Args:
+            source (Union[str, os.PathLike[str], IO[str]]): A file path
+                or a text file object opened with newline="".
+            batch_size (int): Rows sent through the stages at once.
+            sample_rows (int): Rows used to infer the schema.
+            delimiter (str): The field separator.
+
+        Yields:
+            Record: One record per row, with the typed row as payload.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            context: Any = open(
+                source, newline="", encoding="utf-8",
+                buffering=READ_BUFFER_SIZE,
+            )
+        else:
+            context = nullcontext(source)
+
+        with context as file:
+            reader: Iterator[List[str]] = csv.reader(
+                file, delimiter=delimiter
+            )
+            header: List[str] = next(reader, [])
+            sample: List[List[str]] = list(islice(reader, sample_rows))
+            self.schema = {
+                name: infer_type(
+                    row[index] for row in sample if index < len(row)
+                )
+                for index, name in enumerate(header)
+            }
+            columns: List[Tuple[str, Callable[[str], Any]]] = list(
+                self.schema.items()
+            )
+            rows: Iterator[List[str]] = chain(sample, reader)
+            while True:
+                batch: List[Dict[str, Any]] = [
+                    {
+                        name: typed_value(cast, value)
+                        for (name, cast), value in zip(columns, row)
+                    }
+                    for row in islice(rows, batch_size)
+                ]
+                if not batch:
+                    return
+                yield from self.run_batch(batch)
+
     def process(self, data: Any) -> Union[str, Any]:
         """
         Process CSV data through all stages and format the result.
@@ -187,11 +1039,18 @@ class CSVAdapter(ProcessingPipeline):
         Returns:
             Union[str, Any]: Formatted user activity log string.
         """
-        result = data
-        for stage in self.stages:
-            result = stage.process(result)
+        return self.render(self.run_payload(data))
+
+    def render(self, raw: Any) -> Union[str, Any]:
+        """
+        Format a processed CSV line.
 
-        raw = result["data"]["raw"]
+        Args:
+            raw (Any): CSV data as a comma-separated string.
+
+        Returns:
+            Union[str, Any]: Formatted user activity log string.
+        """
         colonnes = raw.split(",")
         nb_actions = len(colonnes) - 2
         return f"User activity logged: {nb_actions} actions processed"
@@ -227,11 +1086,18 @@ class StreamAdapter(ProcessingPipeline):
         Returns:
             Union[str, Any]: Formatted stream summary string.
         """
-        result = data
-        for stage in self.stages:
-            result = stage.process(result)
+        return self.render(self.run_payload(data))
 
-        raw = result["data"]["raw"]
+    def render(self, raw: Any) -> Union[str, Any]:
+        """
+        Format a processed stream of readings.
+
+        Args:
+            raw (Any): Stream data as a list of numerical values.
+
+        Returns:
+            Union[str, Any]: Formatted stream summary string.
+        """
         nb = len(raw)
         avg = sum(raw) / nb
         return f"Stream summary: {nb} readings, avg: {avg:.1f}°C"